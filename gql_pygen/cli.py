@@ -1,31 +1,96 @@
 """Command-line interface for gql-pygen."""
 
-import shutil
-import tarfile
-import tempfile
-import zipfile
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Tuple
 
 import click
 
-from .core.client_generator import ClientGenerator
-from .core.generator import CodeGenerator
-from .core.parser import SchemaParser
+# Heavier modules (archives, graphql-core, Jinja2) are imported where they
+# are used, to keep --help and --version fast
+if TYPE_CHECKING:
+    from .core.ir import IRSchema
+    from .core.parser import SchemaParser
 
 
-def extract_archive(archive_path: Path) -> str:
-    """Extract archive to temp directory. Returns path to extracted content."""
-    temp_dir = tempfile.mkdtemp()
+# Read buffer for archives (tarfile otherwise reads in 10 KiB records)
+ARCHIVE_BUFFER_SIZE = 1 << 20
+
+
+def iter_schema_sources(archive_path: Path) -> Iterator[Tuple[str, str]]:
+    """Yield (member name, text) for each .graphqls file in an archive.
+
+    Files are read straight out of the archive, without extracting to disk.
+    """
     if archive_path.suffix == ".zip":
+        import zipfile
+
         with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            zip_ref.extractall(temp_dir)
+            for info in zip_ref.infolist():
+                if not info.is_dir() and info.filename.endswith(".graphqls"):
+                    yield info.filename, zip_ref.read(info).decode("utf-8")
     elif archive_path.name.endswith((".tar.gz", ".tgz")):
-        with tarfile.open(archive_path, "r:gz") as tar_ref:
-            tar_ref.extractall(temp_dir)
+        import tarfile
+
+        with open(archive_path, "rb", buffering=ARCHIVE_BUFFER_SIZE) as raw:
+            with tarfile.open(fileobj=raw, mode="r|gz") as tar_ref:
+                for member in tar_ref:
+                    if member.isfile() and member.name.endswith(".graphqls"):
+                        content = tar_ref.extractfile(member).read()
+                        yield member.name, content.decode("utf-8")
     else:
-        shutil.rmtree(temp_dir)
         raise ValueError(f"Unsupported archive format: {archive_path.suffix}")
-    return temp_dir
+
+
+def create_parser(schema_path: Path, cache: bool, jobs: int = 1) -> "SchemaParser":
+    """Create a parser for a schema file, directory, or archive."""
+    from .core.cache import default_cache_dir
+    from .core.parser import SchemaParser
+
+    cache_dir = default_cache_dir() if cache else None
+    if schema_path.is_file() and schema_path.name.lower().endswith(
+        (".zip", ".tar.gz", ".tgz")
+    ):
+        click.echo(f"Reading archive {schema_path.name}...")
+        return SchemaParser.from_sources(
+            iter_schema_sources(schema_path), cache_dir=cache_dir, jobs=jobs
+        )
+    return SchemaParser(str(schema_path), cache_dir=cache_dir, jobs=jobs)
+
+
+def _schema_stamp(schema_path: Path) -> Tuple[int, int]:
+    """Return (newest mtime_ns, file count) for a schema file or directory."""
+    if schema_path.is_file():
+        return schema_path.stat().st_mtime_ns, 1
+    mtimes = [
+        os.stat(os.path.join(root, name)).st_mtime_ns
+        for root, _, names in os.walk(schema_path)
+        for name in names
+        if name.endswith(".graphqls")
+    ]
+    return max(mtimes, default=0), len(mtimes)
+
+
+@lru_cache(maxsize=8)
+def _load_ir_cached(
+    schema_path: Path, stamp: Tuple[int, int], cache: bool, jobs: int
+) -> bytes:
+    ir = create_parser(schema_path, cache, jobs).parse_all()
+    return pickle.dumps(ir, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_ir(schema_path: Path, cache: bool = True, jobs: int = 1) -> "IRSchema":
+    """Parse a schema, reusing the IR already built in this process.
+
+    Running several commands in one process (or calling them from Python)
+    over the same unchanged schema parses it only once. Hooks and generators
+    modify the IR they are given, so each call returns its own copy,
+    unpickled from the cached parse (much faster than a deepcopy).
+    """
+    cached = _load_ir_cached(schema_path, _schema_stamp(schema_path), cache, jobs)
+    return pickle.loads(cached)
 
 
 @click.group()
@@ -72,7 +137,38 @@ def main():
     default=False,
     help="Generate async clients (async def + await). Default: sync clients.",
 )
-def generate(schema: str, output: str, templates: str, verbose: bool, is_async: bool):
+@click.option(
+    "--verify",
+    is_flag=True,
+    default=False,
+    help="Check that every generated file is valid Python (slower).",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to parse the schema and render files.",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help=(
+        "Reuse the parsed schema from the previous run if the schema files are "
+        "unchanged, and keep compiled templates between runs."
+    ),
+)
+def generate(
+    schema: str,
+    output: str,
+    templates: str,
+    verbose: bool,
+    is_async: bool,
+    verify: bool,
+    jobs: int,
+    cache: bool,
+):
     """Generate Python code from GraphQL schema.
 
     Examples:
@@ -83,58 +179,46 @@ def generate(schema: str, output: str, templates: str, verbose: bool, is_async:
 
         gql-pygen generate -s ./schema.tgz -o ./generated --templates ./my_templates
     """
+    from .core.cache import default_cache_dir
+    from .core.generator import CodeGenerator
+
     schema_path = Path(schema).resolve()
     output_path = Path(output).resolve()
     template_dir = Path(templates).resolve() if templates else None
-    temp_dir = None
-
-    try:
-        # Handle archives
-        actual_schema_path = schema_path
-        if schema_path.is_file() and schema_path.name.lower().endswith(
-            (".zip", ".tar.gz", ".tgz")
-        ):
-            click.echo(f"Extracting archive {schema_path.name}...")
-            temp_dir = extract_archive(schema_path)
-            actual_schema_path = Path(temp_dir)
-            if verbose:
-                click.echo(f"  Extracted to: {temp_dir}")
-
-        if verbose:
-            click.echo(f"Schema: {actual_schema_path}")
-            click.echo(f"Output: {output_path}")
-            if template_dir:
-                click.echo(f"Templates: {template_dir}")
-
-        # Parse schema
-        click.echo("Parsing schema...")
-        parser = SchemaParser(str(actual_schema_path))
-        ir = parser.parse_all()
-
-        if verbose:
-            click.echo(f"  Scalars: {len(ir.scalars)}")
-            click.echo(f"  Enums: {len(ir.enums)}")
-            click.echo(f"  Types: {len(ir.types)}")
-            click.echo(f"  Inputs: {len(ir.inputs)}")
-            click.echo(f"  Interfaces: {len(ir.interfaces)}")
-            click.echo(f"  Queries: {len(ir.queries)}")
-            click.echo(f"  Mutations: {len(ir.mutations)}")
-
-        # Generate code
-        mode_str = "async" if is_async else "sync"
-        click.echo(f"Generating code ({mode_str} mode)...")
-        generator = CodeGenerator(
-            ir, str(output_path),
-            template_dir=str(template_dir) if template_dir else None,
-            is_async=is_async,
-        )
-        generator.generate()
 
-        click.echo(f"Done! Generated {mode_str} code in {output_path}")
-    finally:
-        # Clean up temp directory
-        if temp_dir:
-            shutil.rmtree(temp_dir)
+    if verbose:
+        click.echo(f"Schema: {schema_path}")
+        click.echo(f"Output: {output_path}")
+        if template_dir:
+            click.echo(f"Templates: {template_dir}")
+
+    # Parse schema
+    click.echo("Parsing schema...")
+    ir = load_ir(schema_path, cache, jobs)
+
+    if verbose:
+        click.echo(f"  Scalars: {len(ir.scalars)}")
+        click.echo(f"  Enums: {len(ir.enums)}")
+        click.echo(f"  Types: {len(ir.types)}")
+        click.echo(f"  Inputs: {len(ir.inputs)}")
+        click.echo(f"  Interfaces: {len(ir.interfaces)}")
+        click.echo(f"  Queries: {len(ir.queries)}")
+        click.echo(f"  Mutations: {len(ir.mutations)}")
+
+    # Generate code
+    mode_str = "async" if is_async else "sync"
+    click.echo(f"Generating code ({mode_str} mode)...")
+    generator = CodeGenerator(
+        ir, str(output_path),
+        template_dir=str(template_dir) if template_dir else None,
+        is_async=is_async,
+        verify_output=verify,
+        jobs=jobs,
+        cache_dir=default_cache_dir() if cache else None,
+    )
+    generator.generate()
+
+    click.echo(f"Done! Generated {mode_str} code in {output_path}")
 
 
 @main.command()
@@ -178,7 +262,20 @@ def generate(schema: str, output: str, templates: str, verbose: bool, is_async:
     default=False,
     help="Generate sync clients instead of async.",
 )
-def client(schema: str, output: str, client_name: str, verbose: bool, is_async: bool, is_sync: bool):
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help="Reuse the parsed schema from the previous run if the schema files are unchanged.",
+)
+def client(
+    schema: str,
+    output: str,
+    client_name: str,
+    verbose: bool,
+    is_async: bool,
+    is_sync: bool,
+    cache: bool,
+):
     """Generate auto-client with typed methods from GraphQL schema.
 
     This generates a nested client structure like:
@@ -195,72 +292,55 @@ def client(schema: str, output: str, client_name: str, verbose: bool, is_async:
 
         gql-pygen client -s ./schema -o ./client.py --sync
     """
+    from .core.client_generator import ClientGenerator
+
     # --sync overrides --async
     use_async = not is_sync
     schema_path = Path(schema).resolve()
     output_path = Path(output).resolve()
-    temp_dir = None
-
-    try:
-        # Handle archives
-        actual_schema_path = schema_path
-        if schema_path.is_file() and schema_path.name.lower().endswith(
-            (".zip", ".tar.gz", ".tgz")
-        ):
-            click.echo(f"Extracting archive {schema_path.name}...")
-            temp_dir = extract_archive(schema_path)
-            actual_schema_path = Path(temp_dir)
-            if verbose:
-                click.echo(f"  Extracted to: {temp_dir}")
-
-        if verbose:
-            click.echo(f"Schema: {actual_schema_path}")
-            click.echo(f"Output: {output_path}")
-
-        # Parse schema
-        click.echo("Parsing schema...")
-        parser = SchemaParser(str(actual_schema_path))
-        ir = parser.parse_all()
-
-        if verbose:
-            click.echo(f"  Types: {len(ir.types)}")
-            click.echo(f"  Enums: {len(ir.enums)}")
-            click.echo(f"  Queries: {len(ir.queries)}")
-            click.echo(f"  Mutations: {len(ir.mutations)}")
-            click.echo(f"  Nested operations: {len([op for op in ir.all_operations if len(op.path) > 1])}")
-
-        # Generate client code
-        mode_str = "async" if use_async else "sync"
-        click.echo(f"Generating client code (class: {client_name}, mode: {mode_str})...")
-        generator = ClientGenerator(ir, client_name=client_name, is_async=use_async)
-        code = generator.generate_client_code()
-
-        # Count stats
-        num_lines = len(code.split('\n'))
-        num_classes = code.count('class ')
-        method_pattern = 'async def ' if use_async else 'def '
-        num_methods = code.count(method_pattern)
-
-        if verbose:
-            click.echo(f"  Lines: {num_lines}")
-            click.echo(f"  Classes: {num_classes}")
-            click.echo(f"  {mode_str.capitalize()} methods: {num_methods}")
-
-        # Create an output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write the file
-        click.echo(f"Writing to {output_path}...")
-        with open(output_path, 'w') as f:
-            f.write(code)
-
-        click.echo(f"Done! Generated {num_classes} client classes with {num_methods} {mode_str} methods.")
+
+    if verbose:
+        click.echo(f"Schema: {schema_path}")
         click.echo(f"Output: {output_path}")
 
-    finally:
-        # Clean up temp directory
-        if temp_dir:
-            shutil.rmtree(temp_dir)
+    # Parse schema
+    click.echo("Parsing schema...")
+    ir = load_ir(schema_path, cache)
+
+    if verbose:
+        click.echo(f"  Types: {len(ir.types)}")
+        click.echo(f"  Enums: {len(ir.enums)}")
+        click.echo(f"  Queries: {len(ir.queries)}")
+        click.echo(f"  Mutations: {len(ir.mutations)}")
+        click.echo(f"  Nested operations: {len([op for op in ir.all_operations if len(op.path) > 1])}")
+
+    # Generate client code
+    mode_str = "async" if use_async else "sync"
+    click.echo(f"Generating client code (class: {client_name}, mode: {mode_str})...")
+    generator = ClientGenerator(ir, client_name=client_name, is_async=use_async)
+    code = generator.generate_client_code()
+
+    # Count stats
+    num_lines = len(code.split('\n'))
+    num_classes = code.count('class ')
+    method_pattern = 'async def ' if use_async else 'def '
+    num_methods = code.count(method_pattern)
+
+    if verbose:
+        click.echo(f"  Lines: {num_lines}")
+        click.echo(f"  Classes: {num_classes}")
+        click.echo(f"  {mode_str.capitalize()} methods: {num_methods}")
+
+    # Create an output directory if needed
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write the file
+    click.echo(f"Writing to {output_path}...")
+    with open(output_path, 'w') as f:
+        f.write(code)
+
+    click.echo(f"Done! Generated {num_classes} client classes with {num_methods} {mode_str} methods.")
+    click.echo(f"Output: {output_path}")
 
 
 if __name__ == "__main__":
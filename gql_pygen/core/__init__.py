@@ -1,43 +1,102 @@
-"""Core modules for GraphQL code generation."""
+"""Core modules for GraphQL code generation.
+
+Public names are imported on first access, so that e.g. the CLI can use
+the parser without also loading the HTTP executor stack.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .auth import (
+        ApiKeyAuth,
+        Auth,
+        BasicAuth,
+        BearerAuth,
+        HeaderAuth,
+        NoAuth,
+    )
+    from .ir import (
+        IRArgument,
+        IREnum,
+        IREnumValue,
+        IRField,
+        IRInterface,
+        IROperation,
+        IRScalar,
+        IRSchema,
+        IRType,
+    )
+    from .parser import SchemaParser
+    from .query_builder import FieldSelection, FieldSelectionMode, QueryBuilder
+    from .executor import GraphQLError, GraphQLExecutor
+    from .client_generator import ClientGenerator
+    from .scalars import (
+        DateHandler,
+        DateTimeHandler,
+        JSONHandler,
+        ScalarHandler,
+        ScalarRegistry,
+        UUIDHandler,
+    )
+    from .hooks import (
+        AddHeaderHook,
+        FilterTypesHook,
+        HookRunner,
+        PostGenerateHook,
+        PreGenerateHook,
+    )
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "ApiKeyAuth": "auth",
+    "Auth": "auth",
+    "BasicAuth": "auth",
+    "BearerAuth": "auth",
+    "HeaderAuth": "auth",
+    "NoAuth": "auth",
+    "IRArgument": "ir",
+    "IREnum": "ir",
+    "IREnumValue": "ir",
+    "IRField": "ir",
+    "IRInterface": "ir",
+    "IROperation": "ir",
+    "IRScalar": "ir",
+    "IRSchema": "ir",
+    "IRType": "ir",
+    "SchemaParser": "parser",
+    "FieldSelection": "query_builder",
+    "FieldSelectionMode": "query_builder",
+    "QueryBuilder": "query_builder",
+    "GraphQLError": "executor",
+    "GraphQLExecutor": "executor",
+    "ClientGenerator": "client_generator",
+    "DateHandler": "scalars",
+    "DateTimeHandler": "scalars",
+    "JSONHandler": "scalars",
+    "ScalarHandler": "scalars",
+    "ScalarRegistry": "scalars",
+    "UUIDHandler": "scalars",
+    "AddHeaderHook": "hooks",
+    "FilterTypesHook": "hooks",
+    "HookRunner": "hooks",
+    "PostGenerateHook": "hooks",
+    "PreGenerateHook": "hooks",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from .auth import (
-    ApiKeyAuth,
-    Auth,
-    BasicAuth,
-    BearerAuth,
-    HeaderAuth,
-    NoAuth,
-)
-from .ir import (
-    IRArgument,
-    IREnum,
-    IREnumValue,
-    IRField,
-    IRInterface,
-    IROperation,
-    IRScalar,
-    IRSchema,
-    IRType,
-)
-from .parser import SchemaParser
-from .query_builder import FieldSelection, FieldSelectionMode, QueryBuilder
-from .executor import GraphQLError, GraphQLExecutor
-from .client_generator import ClientGenerator
-from .scalars import (
-    DateHandler,
-    DateTimeHandler,
-    JSONHandler,
-    ScalarHandler,
-    ScalarRegistry,
-    UUIDHandler,
-)
-from .hooks import (
-    AddHeaderHook,
-    FilterTypesHook,
-    HookRunner,
-    PostGenerateHook,
-    PreGenerateHook,
-)
 
 __all__ = [
     # Auth
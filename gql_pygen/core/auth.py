@@ -5,7 +5,11 @@ Users can implement custom auth or use built-in handlers.
 """
 
 import base64
-from typing import Dict, Protocol, runtime_checkable
+from typing import Dict, Optional, Tuple
+
+# typing_extensions' Protocol collects its members once, at class creation,
+# instead of on every isinstance() check as typing's does before 3.12
+from typing_extensions import Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -83,11 +87,18 @@ class BasicAuth:
     def __init__(self, username: str, password: str):
         self.username = username
         self.password = password
+        # Encoded header value and the credentials it was built from
+        self._encoded_for: Optional[Tuple[str, str]] = None
+        self._authorization = ""
     
     def get_headers(self) -> Dict[str, str]:
-        credentials = f"{self.username}:{self.password}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return {"Authorization": f"Basic {encoded}"}
+        # Called once per request: only re-encode if the credentials changed
+        credentials = (self.username, self.password)
+        if credentials != self._encoded_for:
+            encoded = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
+            self._authorization = f"Basic {encoded}"
+            self._encoded_for = credentials
+        return {"Authorization": self._authorization}
 
 
 class HeaderAuth:
@@ -104,7 +115,9 @@ class HeaderAuth:
     """
     
     def __init__(self, headers: Dict[str, str]):
-        self._headers = headers
+        # Copy so later changes to the caller's dict don't leak in. Executors
+        # build their headers once, so get_headers can return a fresh copy.
+        self._headers = dict(headers)
     
     def get_headers(self) -> Dict[str, str]:
         return self._headers.copy()
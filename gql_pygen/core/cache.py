@@ -0,0 +1,123 @@
+"""On-disk cache for parsed schemas.
+
+Parsing is the slowest step of generation, and it is repeated on every
+run even when only templates or options changed. The parsed IRSchema is
+pickled under a key derived from the schema files (their paths, sizes
+and mtimes, or for archives read in place, their names and contents),
+so unchanged schemas are loaded instead of re-parsed. When that misses,
+each file's parsed document is also cached by content, so editing one
+file of a large schema only re-parses that file.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, List, Optional, Tuple
+
+from graphql import DocumentNode
+from graphql import version as graphql_version
+
+from .. import __version__
+from .ir import IRSchema
+
+# Bump when the IR layout changes in a way old pickles can't represent
+CACHE_FORMAT = 2
+
+
+def default_cache_dir() -> str:
+    """Return the per-user cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "gql-pygen")
+
+
+def schema_cache_key(schema_root: str, schema_files: List[str]) -> str:
+    """Build a cache key from the schema files' relative paths, sizes and mtimes.
+
+    Paths are taken relative to schema_root, so a schema directory that is
+    moved or copied elsewhere still hits the cache. Archives are read in
+    place rather than from files on disk and use source_cache_key instead.
+    """
+    root = schema_root if os.path.isdir(schema_root) else os.path.dirname(schema_root)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{__version__}:{CACHE_FORMAT}".encode())
+    for path in schema_files:
+        stat = os.stat(path)
+        rel_path = os.path.relpath(path, root)
+        digest.update(f"\0{rel_path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def source_cache_key(sources: List[Tuple[str, str]]) -> str:
+    """Build a cache key from in-memory (file name, content) schema sources."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{__version__}:{CACHE_FORMAT}".encode())
+    for name, content in sources:
+        digest.update(f"\0{name}\0{len(content)}\0".encode())
+        digest.update(content.encode())
+    return digest.hexdigest()
+
+
+def document_cache_key(content: str) -> str:
+    """Build a cache key for one schema file's parsed document.
+
+    Keyed by content alone, so that when a single file in a large schema
+    changes, every other file's document is still served from the cache.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{graphql_version}:{CACHE_FORMAT}\0".encode())
+    digest.update(content.encode())
+    return digest.hexdigest()
+
+
+def _load_pickle(path: str) -> Any:
+    """Unpickle path, returning None on a miss or unreadable entry."""
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+
+def _save_pickle(cache_dir: str, file_name: str, value: Any):
+    """Atomically pickle value into cache_dir. Write failures are ignored."""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file and rename so readers never see partial data
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, os.path.join(cache_dir, file_name))
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        # Don't leave the partial temp file behind
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def load_cached_ir(cache_dir: str, key: str) -> Optional[IRSchema]:
+    """Return the cached IR for key, or None on a miss or unreadable entry."""
+    ir = _load_pickle(os.path.join(cache_dir, f"{key}.pickle"))
+    return ir if isinstance(ir, IRSchema) else None
+
+
+def save_cached_ir(cache_dir: str, key: str, ir: IRSchema):
+    """Store ir under key. Failures to write the cache are ignored."""
+    _save_pickle(cache_dir, f"{key}.pickle", ir)
+
+
+def load_cached_document(cache_dir: str, key: str) -> Optional[DocumentNode]:
+    """Return the cached parsed document for key, or None on a miss."""
+    document = _load_pickle(os.path.join(cache_dir, f"{key}.doc.pickle"))
+    return document if isinstance(document, DocumentNode) else None
+
+
+def save_cached_document(cache_dir: str, key: str, document: DocumentNode):
+    """Store a parsed document under key. Failures are ignored."""
+    _save_pickle(cache_dir, f"{key}.doc.pickle", document)
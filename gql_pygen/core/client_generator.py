@@ -7,44 +7,157 @@ Generates a nested client structure like:
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from string import Template
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .ir import IROperation, IRSchema
 
-
-@dataclass
+# Word boundaries for camelCase -> snake_case
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
+
+# Python reserved keywords (plus the "type" builtin) escaped in parameter names
+RESERVED_KEYWORDS = frozenset({
+    "from", "import", "class", "def", "return", "yield", "raise",
+    "try", "except", "finally", "with", "as", "pass", "break",
+    "continue", "if", "elif", "else", "for", "while", "and", "or",
+    "not", "in", "is", "lambda", "global", "nonlocal", "True",
+    "False", "None", "async", "await", "type",
+})
+
+# Generated code skeletons, rendered with one substitute() call each.
+# Templates are appended to the line buffer as multi-line entries.
+_CLASS_HEADER_TEMPLATE = Template('''\
+class $class_name:
+    """Client for $node_name operations."""
+
+    def __init__(self, executor: GraphQLExecutor, query_builder: QueryBuilder):
+        self._executor = executor
+        self._query_builder = query_builder''')
+
+_METHOD_TEMPLATE = Template('''\
+    async def $method_name(
+$params
+    ) -> $return_type:
+        """$description"""
+        variables = {
+$variables        }
+        # Operation path: $path
+        result = await self._executor.execute_operation(
+            operation_path=$path,
+            variables={k: v for k, v in variables.items() if v is not None},
+            fields=fields,
+            serialized=True,
+        )
+$parse_result
+''')
+
+# Response parsing with model_validate(), keyed by (is_list, is_optional).
+# $validate is a lazily bound _validate_<Type> name or a <Type>.model_validate lookup.
+_RETURN_TEMPLATES = {
+    # Optional[List[T]] - return None or list of parsed models
+    (True, True): Template('''\
+        if result is None:
+            return None
+        return [$validate(item) for item in result]'''),
+    # List[T] - return list of parsed models (empty list if None)
+    (True, False): Template('''\
+        if result is None:
+            return []
+        return [$validate(item) for item in result]'''),
+    # Optional[T] - return None or parsed model
+    (False, True): Template('''\
+        if result is None:
+            return None
+        return $validate(result)'''),
+    # T - return parsed model (required)
+    (False, False): Template('''\
+        return $validate(result)'''),
+}
+
+# Generated helper behind the _validate_<Type> names. The first call looks the
+# model up and rebinds the name to its model_validate, so importing the client
+# never depends on a model being present.
+_LAZY_VALIDATOR = '''\
+def _lazy_validator(name: str):
+    """Return a validator that binds <name>.model_validate on first use."""
+    def validate(data):
+        model = globals().get(name)
+        if model is None:
+            raise NameError(f"name {name!r} is not defined")
+        validator = globals()["_validate_" + name] = model.model_validate
+        return validator(data)
+    return validate
+
+'''
+
+# Map GraphQL built-in scalars to Python types
+_TYPE_MAP = {
+    "String": "str",
+    "Int": "int",
+    "Float": "float",
+    "Boolean": "bool",
+    "ID": "str",
+}
+
+
+@dataclass(slots=True)
 class ClientNode:
     """Represents a node in the client hierarchy."""
     name: str  # e.g., "policy", "internetFirewall"
     snake_name: str  # e.g., "policy", "internet_firewall"
     children: Dict[str, "ClientNode"] = field(default_factory=dict)
     operations: List[IROperation] = field(default_factory=list)
+    # (name, child) pairs sorted by name; reset when a child is added
+    _sorted_children: Optional[List[Tuple[str, "ClientNode"]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def sorted_children(self) -> List[Tuple[str, "ClientNode"]]:
+        """Return (name, child) pairs sorted by name, computed once."""
+        if self._sorted_children is None:
+            self._sorted_children = sorted(self.children.items())
+        return self._sorted_children
     
     def add_operation(self, path: List[str], operation: IROperation):
         """Add an operation at the given path."""
-        if len(path) == 1:
-            # This is the leaf - add the operation here
-            self.operations.append(operation)
-        else:
-            # Navigate/create child nodes
-            child_name = path[0]
-            if child_name not in self.children:
-                self.children[child_name] = ClientNode(
+        node = self
+        # Navigate/create child nodes; the last segment is the operation itself
+        for child_name in path[:-1]:
+            child = node.children.get(child_name)
+            if child is None:
+                child = node.children[child_name] = ClientNode(
                     name=child_name,
                     snake_name=to_snake_case(child_name),
                 )
-            self.children[child_name].add_operation(path[1:], operation)
+                node._sorted_children = None
+            node = child
+        node.operations.append(operation)
 
 
+@lru_cache(maxsize=None)
 def to_snake_case(name: str) -> str:
     """Convert camelCase to snake_case."""
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    s1 = _CAMEL_WORD_RE.sub(r'\1_\2', name)
+    return _CAMEL_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
 
 
+@lru_cache(maxsize=None)
 def to_pascal_case(name: str) -> str:
     """Convert snake_case or camelCase to PascalCase."""
-    # First convert to snake_case, then to PascalCase
+    # Plain camelCase (no underscores, no runs of capitals) only needs its
+    # first letter raised; the word split below would give the same result
+    prev_upper = False
+    for char in name:
+        is_upper = char.isupper()
+        if char == "_" or (is_upper and prev_upper):
+            break
+        prev_upper = is_upper
+    else:
+        return name[:1].upper() + name[1:]
+    # Otherwise convert to snake_case, then to PascalCase
     snake = to_snake_case(name)
     return "".join(word.capitalize() for word in snake.split("_"))
 
@@ -79,26 +192,44 @@ class ClientGenerator:
             "",
             "from .auth import Auth, ApiKeyAuth, BearerAuth, BasicAuth, HeaderAuth, NoAuth",
             "from .query_builder import FieldSelection, QueryBuilder",
-            "from .executor import GraphQLExecutor",
+            "from .executor import GraphQLExecutor, serialize_input",
             "from ..models import *  # Import models for runtime model_validate()",
             "",
         ]
+
+        # Each response model's model_validate is bound to a module-level
+        # name on first use, so methods then do a single global lookup per
+        # parsed item and a missing model only breaks the methods using it
+        validated = sorted({
+            op.return_type
+            for op in chain(self.schema.queries, self.schema.mutations)
+            if op.return_type in self.schema.types
+        })
+        if validated:
+            lines += ["", _LAZY_VALIDATOR]
+            lines += [
+                f'{self._validator_name(name)} = _lazy_validator("{name}")'
+                for name in validated
+            ]
+            lines.append("")
+            lines.append("")
         
-        # Generate namespace client classes
+        # Generate namespace client classes. The helpers all append to
+        # this one list, which is joined once at the end.
         generated_classes = set()
         
         # Generate mutation clients
-        lines.extend(self._generate_client_classes(
-            self.mutation_tree, "Mutation", generated_classes
-        ))
+        self._generate_client_classes(
+            self.mutation_tree, "Mutation", generated_classes, lines
+        )
         
         # Generate query clients
-        lines.extend(self._generate_client_classes(
-            self.query_tree, "Query", generated_classes
-        ))
+        self._generate_client_classes(
+            self.query_tree, "Query", generated_classes, lines
+        )
         
         # Generate root client
-        lines.extend(self._generate_root_client())
+        self._generate_root_client(lines)
         
         return "\n".join(lines)
     
@@ -107,21 +238,26 @@ class ClientGenerator:
         node: ClientNode,
         prefix: str,
         generated: Set[str],
+        lines: Optional[List[str]] = None,
     ) -> List[str]:
-        """Recursively generate client classes for a node and its children."""
-        lines = []
+        """Recursively generate client classes for a node and its children.
+
+        Lines are appended to `lines` (a new list if omitted), which is returned.
+        """
+        if lines is None:
+            lines = []
         
         # Generate classes for children first (bottom-up)
-        for child_name, child_node in sorted(node.children.items()):
+        for child_name, child_node in node.sorted_children():
             child_prefix = f"{prefix}_{to_pascal_case(child_name)}"
-            lines.extend(self._generate_client_classes(child_node, child_prefix, generated))
+            self._generate_client_classes(child_node, child_prefix, generated, lines)
         
         # Generate this node's class if it has operations or children
         if node.operations or node.children:
             class_name = f"{prefix}Client"
             if class_name not in generated:
                 generated.add(class_name)
-                lines.extend(self._generate_single_client_class(node, class_name))
+                self._generate_single_client_class(node, class_name, lines)
         
         return lines
     
@@ -129,19 +265,17 @@ class ClientGenerator:
         self,
         node: ClientNode,
         class_name: str,
+        lines: Optional[List[str]] = None,
     ) -> List[str]:
-        """Generate a single client class."""
-        lines = [
-            f"class {class_name}:",
-            f'    """Client for {node.name} operations."""',
-            "",
-            "    def __init__(self, executor: GraphQLExecutor, query_builder: QueryBuilder):",
-            "        self._executor = executor",
-            "        self._query_builder = query_builder",
-        ]
+        """Generate a single client class, appending to `lines`."""
+        if lines is None:
+            lines = []
+        lines.append(
+            _CLASS_HEADER_TEMPLATE.substitute(class_name=class_name, node_name=node.name)
+        )
         
         # Initialize child clients
-        for child_name, child_node in sorted(node.children.items()):
+        for child_name, child_node in node.sorted_children():
             child_class = f"{class_name[:-6]}_{to_pascal_case(child_name)}Client"
             lines.append(f"        self.{child_node.snake_name} = {child_class}(executor, query_builder)")
         
@@ -149,13 +283,15 @@ class ClientGenerator:
         
         # Generate operation methods
         for op in node.operations:
-            lines.extend(self._generate_operation_method(op))
+            self._generate_operation_method(op, lines)
 
         lines.append("")
         return lines
 
-    def _generate_operation_method(self, op: IROperation) -> List[str]:
-        """Generate an async method for an operation."""
+    def _generate_operation_method(
+        self, op: IROperation, lines: Optional[List[str]] = None
+    ) -> List[str]:
+        """Generate an async method for an operation, appending to `lines`."""
         method_name = to_snake_case(op.name)
 
         # Build parameter list with unique names for duplicates
@@ -165,18 +301,7 @@ class ClientGenerator:
         required_params: List[str] = []
         optional_params: List[str] = []
 
-        # Python reserved keywords that need to be escaped
-        RESERVED_KEYWORDS = {
-            "from", "import", "class", "def", "return", "yield", "raise",
-            "try", "except", "finally", "with", "as", "pass", "break",
-            "continue", "if", "elif", "else", "for", "while", "and", "or",
-            "not", "in", "is", "lambda", "global", "nonlocal", "True",
-            "False", "None", "async", "await", "type",
-        }
-
         for arg in op.all_arguments:
-            base_param_name = to_snake_case(arg.name)
-
             # Compute unique variable name (matching query builder)
             var_name = arg.name
             if var_name in seen_var_names:
@@ -211,69 +336,55 @@ class ClientGenerator:
         if op.is_return_optional:
             return_type = f"Optional[{return_type}]"
 
-        # Build method signature
-        lines = [
-            f"    async def {method_name}(",
-        ]
-        for i, param in enumerate(params):
-            comma = "," if i < len(params) - 1 else ""
-            lines.append(f"        {param}{comma}")
-        lines.append(f"    ) -> {return_type}:")
-
-        # Docstring
-        desc = op.description or f"Execute {op.name} operation."
-        lines.append(f'        """{desc}"""')
-
-        # Build variables dict using unique variable names
-        lines.append("        variables = {")
-        for arg, param_name, var_name in arg_to_param:
-            lines.append(f'            "{var_name}": {param_name},')
-        lines.append("        }")
-
-        # Get operation reference (we'll need to store ops or look them up)
-        lines.append(f"        # Operation path: {op.path}")
-        lines.append(f"        result = await self._executor.execute_operation(")
-        lines.append(f'            operation_path={op.path!r},')
-        lines.append(f"            variables=variables,")
-        lines.append(f"            fields=fields,")
-        lines.append(f"        )")
-
-        # Add response parsing with model_validate()
-        base_type = op.return_type
-        if op.is_return_list and op.is_return_optional:
-            # Optional[List[T]] - return None or list of parsed models
-            lines.append(f"        if result is None:")
-            lines.append(f"            return None")
-            lines.append(f"        return [{base_type}.model_validate(item) for item in result]")
-        elif op.is_return_list:
-            # List[T] - return list of parsed models (empty list if None)
-            lines.append(f"        if result is None:")
-            lines.append(f"            return []")
-            lines.append(f"        return [{base_type}.model_validate(item) for item in result]")
-        elif op.is_return_optional:
-            # Optional[T] - return None or parsed model
-            lines.append(f"        if result is None:")
-            lines.append(f"            return None")
-            lines.append(f"        return {base_type}.model_validate(result)")
-        else:
-            # T - return parsed model (required)
-            lines.append(f"        return {base_type}.model_validate(result)")
-        lines.append("")
+        if lines is None:
+            lines = []
+        variables = "".join(
+            f'            "{var_name}": {self._serialize_expr(arg, param_name)},\n'
+            for arg, param_name, var_name in arg_to_param
+        )
+        tail = _RETURN_TEMPLATES[op.is_return_list, op.is_return_optional]
+        lines.append(_METHOD_TEMPLATE.substitute(
+            method_name=method_name,
+            params=",\n".join(f"        {param}" for param in params),
+            return_type=return_type,
+            description=op.description or f"Execute {op.name} operation.",
+            variables=variables,
+            # A tuple literal is a constant, and is the executor's lookup key
+            path=repr(tuple(op.path)),
+            parse_result=tail.substitute(validate=self._validator_expr(op.return_type)),
+        ))
 
         return lines
 
+    @staticmethod
+    def _validator_name(type_name: str) -> str:
+        """Module-level name bound to a response model's model_validate."""
+        return f"_validate_{type_name}"
+
+    def _validator_expr(self, type_name: str) -> str:
+        """Expression that validates a response into `type_name`.
+
+        Object types get a lazy module-level binding from
+        generate_client_code(); anything else keeps the plain attribute lookup.
+        """
+        if type_name in self.schema.types:
+            return self._validator_name(type_name)
+        return f"{type_name}.model_validate"
+
+    def _serialize_expr(self, arg, param_name: str) -> str:
+        """Python expression that serializes an argument for the request.
+
+        The argument's type is known here, so only input-object arguments
+        go through the runtime serialize_input() helper, which also accepts
+        plain dicts; scalars and enums are passed through unchanged.
+        """
+        if arg.type_name in self.schema.inputs:
+            return f"serialize_input({param_name})"
+        return param_name
+
     def _arg_type_hint(self, arg) -> str:
         """Get Python type hint for an argument."""
-        # Map GraphQL types to Python types
-        type_map = {
-            "String": "str",
-            "Int": "int",
-            "Float": "float",
-            "Boolean": "bool",
-            "ID": "str",
-        }
-
-        base_type = type_map.get(arg.type_name, arg.type_name)
+        base_type = _TYPE_MAP.get(arg.type_name, arg.type_name)
 
         if arg.is_list:
             return f"List[{base_type}]"
@@ -288,9 +399,11 @@ class ClientGenerator:
         # Convert to camelCase
         return name[0].lower() + name[1:] if name else "arg"
 
-    def _generate_root_client(self) -> List[str]:
-        """Generate the root client class."""
-        lines = [
+    def _generate_root_client(self, lines: Optional[List[str]] = None) -> List[str]:
+        """Generate the root client class, appending to `lines`."""
+        if lines is None:
+            lines = []
+        lines += [
             f"class {self.client_name}:",
             '    """Auto-generated GraphQL client.',
             "",
@@ -329,7 +442,7 @@ class ClientGenerator:
         ]
 
         # Initialize top-level namespace clients
-        for child_name, child_node in sorted(self.mutation_tree.children.items()):
+        for child_name, child_node in self.mutation_tree.sorted_children():
             child_class = f"Mutation_{to_pascal_case(child_name)}Client"
             lines.append(f"        self.{child_node.snake_name} = {child_class}(self._executor, self._query_builder)")
 
@@ -3,15 +3,63 @@
 Handles HTTP communication, error handling, and response parsing.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import json
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
 from pydantic import BaseModel
 
+try:  # Optional: much faster JSON encode/decode (pip install gql-pygen[fast])
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+try:  # Optional: HTTP/2 for the default client (pip install gql-pygen[fast])
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - exercised when h2 is absent
+    _HTTP2 = False
+
 from .auth import ApiKeyAuth, Auth
 from .ir import IROperation, IRSchema
 from .query_builder import FieldSelection, QueryBuilder
 
+# Connection pool for the executor's own client, sized for many concurrent
+# execute_operation calls against one endpoint
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a request payload as JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def serialize_input(value: Any) -> Any:
+    """Serialize an input-object argument for a request.
+
+    Generated clients call this only for input-object arguments. Models,
+    alone or in a list, are dumped by alias without None fields; plain
+    dicts and None are sent as given.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True, exclude_none=True)
+    if isinstance(value, list):
+        return [
+            v.model_dump(by_alias=True, exclude_none=True) if isinstance(v, BaseModel) else v
+            for v in value
+        ]
+    return value
+
 
 class GraphQLError(Exception):
     """Exception raised for GraphQL errors."""
@@ -37,6 +85,11 @@ class GraphQLExecutor:
 
         # Custom auth
         executor = GraphQLExecutor(url, auth=MyCustomAuth())
+
+        # Share one connection pool between executors
+        async with httpx.AsyncClient(http2=True) as http:
+            a = GraphQLExecutor(url_a, auth=auth_a, client=http)
+            b = GraphQLExecutor(url_b, auth=auth_b, client=http)
     """
 
     def __init__(
@@ -47,6 +100,7 @@ class GraphQLExecutor:
         api_key: Optional[str] = None,  # Deprecated: use auth=ApiKeyAuth(key)
         schema: Optional[IRSchema] = None,
         timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the executor.
 
@@ -55,11 +109,16 @@ class GraphQLExecutor:
             auth: Authentication handler (implements Auth protocol)
             api_key: DEPRECATED - API key for authentication. Use auth=ApiKeyAuth(key) instead.
             schema: Optional schema for query building (can be set later)
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds (only for the executor's own client)
+            client: Optional shared HTTP client. The executor sends its auth
+                    headers with each request and does not close it.
         """
         self.url = url
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
+        # Per-request headers, only needed when the client is shared
+        self._request_headers: Optional[Dict[str, str]] = None
         self._query_builder: Optional[QueryBuilder] = None
 
         # Handle auth - support both new auth parameter and legacy api_key
@@ -71,8 +130,13 @@ class GraphQLExecutor:
         else:
             raise ValueError("Either 'auth' or 'api_key' must be provided")
 
+        if client is not None:
+            self._request_headers = self._build_headers()
+
         # Operation lookup by path
         self._operations: Dict[tuple, IROperation] = {}
+        # Built query strings by (path, field selection), see execute_operation
+        self._query_cache: Dict[tuple, str] = {}
 
         if schema:
             self._init_schema(schema)
@@ -81,27 +145,33 @@ class GraphQLExecutor:
         """Initialize query builder and operation lookup from schema."""
         self.schema = schema
         self._query_builder = QueryBuilder(schema)
+        self._query_cache.clear()
         
-        # Build operation lookup
-        for op in schema.queries + schema.mutations:
-            self._operations[tuple(op.path)] = op
+        # Build operation lookup, chaining rather than concatenating the lists
+        self._operations.update(
+            (tuple(op.path), op) for op in chain(schema.queries, schema.mutations)
+        )
     
+    def _build_headers(self) -> Dict[str, str]:
+        """Build request headers from the auth handler."""
+        headers = {"Content-Type": "application/json"}
+        headers.update(self._auth.get_headers())
+        return headers
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
-            # Build headers from auth handler
-            headers = {"Content-Type": "application/json"}
-            headers.update(self._auth.get_headers())
-
             self._client = httpx.AsyncClient(
                 timeout=self.timeout,
-                headers=headers,
+                headers=self._build_headers(),
+                http2=_HTTP2,
+                limits=_CLIENT_LIMITS,
             )
         return self._client
     
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
+        """Close the HTTP client, unless it was passed in by the caller."""
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
     
@@ -109,12 +179,16 @@ class GraphQLExecutor:
         self,
         query: str,
         variables: Optional[Dict[str, Any]] = None,
+        *,
+        serialized: bool = False,
     ) -> Dict[str, Any]:
         """Execute a raw GraphQL query.
         
         Args:
             query: GraphQL query string
             variables: Query variables
+            serialized: True if variables are already JSON-ready (models
+                        dumped, None values dropped), as generated clients do
             
         Returns:
             The 'data' portion of the response
@@ -126,12 +200,17 @@ class GraphQLExecutor:
         
         payload = {"query": query}
         if variables:
-            payload["variables"] = self._serialize_variables(variables)
+            payload["variables"] = (
+                variables if serialized else self._serialize_variables(variables)
+            )
         
-        response = await client.post(self.url, json=payload)
+        # The client (or the shared-client headers) sets Content-Type: application/json
+        response = await client.post(
+            self.url, content=_dumps(payload), headers=self._request_headers
+        )
         response.raise_for_status()
         
-        result = response.json()
+        result = _loads(response.content)
         
         if "errors" in result:
             error_messages = "; ".join(e.get("message", str(e)) for e in result["errors"])
@@ -141,16 +220,20 @@ class GraphQLExecutor:
     
     async def execute_operation(
         self,
-        operation_path: List[str],
+        operation_path: Union[Tuple[str, ...], List[str]],
         variables: Dict[str, Any],
         fields: FieldSelection = FieldSelection.ALL,
+        *,
+        serialized: bool = False,
     ) -> Any:
         """Execute an operation by its path.
         
         Args:
-            operation_path: Path like ['policy', 'internetFirewall', 'addRule']
+            operation_path: Path like ('policy', 'internetFirewall', 'addRule').
+                            A tuple is used as the lookup key as-is.
             variables: Operation variables
             fields: Field selection mode
+            serialized: True if variables are already JSON-ready
             
         Returns:
             The operation result (extracted from nested response)
@@ -159,51 +242,103 @@ class GraphQLExecutor:
             raise RuntimeError("Schema not initialized. Call _init_schema first.")
         
         # Look up the operation
-        op_key = tuple(operation_path)
+        op_key = (
+            operation_path if type(operation_path) is tuple else tuple(operation_path)
+        )
         operation = self._operations.get(op_key)
         if not operation:
             raise ValueError(f"Unknown operation: {'.'.join(operation_path)}")
         
-        # Build the query
-        query = self._query_builder.build(operation, fields)
+        # Build the query, or reuse it
+        cache_key = (op_key, fields)
+        query = self._query_cache.get(cache_key)
+        if query is None:
+            query = self._query_cache[cache_key] = self._query_builder.build(
+                operation, fields
+            )
         
         # Execute
-        data = await self.execute(query, variables)
+        data = await self.execute(query, variables, serialized=serialized)
         
         # Extract the nested result
         return self._extract_path(data, operation_path)
     
+    async def execute_many(
+        self,
+        calls: List[Tuple[List[str], Dict[str, Any], FieldSelection]],
+        *,
+        serialized: bool = False,
+    ) -> List[Any]:
+        """Execute several operations in one HTTP request.
+
+        The operations are merged into a single document with aliased root
+        fields (see QueryBuilder.build_batch), so they must all be queries or
+        all be mutations.
+
+        Args:
+            calls: (operation_path, variables, fields) per operation
+            serialized: True if every variables dict is already JSON-ready
+
+        Returns:
+            The operation results, in the same order as calls
+        """
+        if not self._query_builder:
+            raise RuntimeError("Schema not initialized. Call _init_schema first.")
+        if not calls:
+            return []
+
+        operations = []
+        merged_variables: Dict[str, Any] = {}
+        for index, (operation_path, variables, fields) in enumerate(calls):
+            operation = self._operations.get(tuple(operation_path))
+            if not operation:
+                raise ValueError(f"Unknown operation: {'.'.join(operation_path)}")
+            operations.append((operation, fields))
+            if not serialized:
+                variables = self._serialize_variables(variables)
+            for var_name, value in variables.items():
+                merged_variables[QueryBuilder.batch_variable(index, var_name)] = value
+
+        query = self._query_builder.build_batch(operations)
+        data = await self.execute(query, merged_variables, serialized=True)
+
+        # Each result sits under its alias instead of the first path segment
+        return [
+            self._extract_path(data, [QueryBuilder.batch_alias(index), *path[1:]])
+            for index, (path, _, _) in enumerate(calls)
+        ]
+
     def _extract_path(self, data: Dict[str, Any], path: List[str]) -> Any:
         """Extract nested data at the given path."""
         result = data
-        for segment in path:
-            if result is None:
-                return None
-            if isinstance(result, dict):
-                result = result.get(segment)
-            else:
-                return None
+        # Responses are nearly always dicts all the way down, so index
+        # directly and treat a missing key or non-dict level as no data
+        try:
+            for segment in path:
+                if result is None:
+                    return None
+                result = result[segment]
+        except (KeyError, TypeError):
+            return None
         return result
 
     def _serialize_variables(self, variables: Dict[str, Any]) -> Dict[str, Any]:
         """Serialize variables for the GraphQL request.
 
-        Handles Pydantic models by converting them to dicts.
+        Handles Pydantic models by converting them to dicts. Variables that
+        are all plain non-None values are returned as-is, without a copy.
         """
+        for value in variables.values():
+            if value is None or isinstance(value, (BaseModel, list)):
+                break
+        else:
+            return variables
+
         result = {}
         for key, value in variables.items():
             if value is None:
                 continue  # Skip None values
-            if isinstance(value, BaseModel):
-                # Convert Pydantic model to dict, using aliases and excluding None
-                result[key] = value.model_dump(by_alias=True, exclude_none=True)
-            elif isinstance(value, list):
-                # Handle lists of models
-                result[key] = [
-                    v.model_dump(by_alias=True, exclude_none=True) if isinstance(v, BaseModel) else v
-                    for v in value
-                ]
-            else:
-                result[key] = value
+            # Convert Pydantic models, alone or in lists, to dicts
+            result[key] = serialize_input(value)
         return result
 
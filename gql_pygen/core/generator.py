@@ -11,27 +11,48 @@ Template lookup order:
 """
 
 import ast
+import keyword
 import os
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
-from jinja2 import ChoiceLoader, Environment, FileSystemLoader, PackageLoader, select_autoescape
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    PackageLoader,
+    select_autoescape,
+)
 
-from .ir import IRSchema
+from .ir import IRInterface, IRSchema, IRType
 
 
+_CAMEL_WORD_RE = re.compile("(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile("([a-z0-9])([A-Z])")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+# Case conversions are pure and called for the same names over and over
+# while rendering, so they are memoized for the lifetime of the process.
+@lru_cache(maxsize=None)
 def snake_case(name: str) -> str:
     """Convert PascalCase or camelCase to snake_case."""
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _CAMEL_WORD_RE.sub(r"\1_\2", name)
+    return _CAMEL_BOUNDARY_RE.sub(r"\1_\2", s1).lower()
 
 
+@lru_cache(maxsize=None)
 def pascal_case(name: str) -> str:
     """Convert snake_case to PascalCase."""
     return "".join(word.capitalize() for word in name.split("_"))
 
 
+@lru_cache(maxsize=None)
 def upper_case(name: str) -> str:
     """Convert to UPPER_CASE."""
     return snake_case(name).upper()
@@ -47,6 +68,7 @@ def safe_docstring(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=4096)
 def safe_comment(text: str) -> str:
     """Make text safe for a single-line Python comment.
 
@@ -60,24 +82,23 @@ def safe_comment(text: str) -> str:
     # Remove Markdown bold/italic markers
     text = text.replace('**', '').replace('*', '')
     # Collapse multiple spaces
-    import re
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     # Truncate very long descriptions
     if len(text) > 120:
         text = text[:117] + "..."
     return text.strip()
 
 
-# Python reserved keywords that cannot be used as parameter names
-PYTHON_KEYWORDS = {
-    'False', 'None', 'True', 'and', 'as', 'assert', 'async', 'await',
-    'break', 'class', 'continue', 'def', 'del', 'elif', 'else', 'except',
-    'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is',
-    'lambda', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'try',
-    'while', 'with', 'yield'
-}
+# Python reserved keywords that cannot be used as parameter names.
+# Soft keywords (match, case, type, _) are valid identifiers and are left alone.
+PYTHON_KEYWORDS = frozenset(keyword.kwlist)
+
+
+# Built-in GraphQL scalars (never expanded into sub-selections)
+BUILTIN_SCALARS = frozenset({"String", "Int", "Float", "Boolean", "ID"})
 
 
+@lru_cache(maxsize=4096)
 def safe_param_name(name: str) -> str:
     """Make a parameter name safe for Python by suffixing keywords with underscore."""
     if name in PYTHON_KEYWORDS:
@@ -85,6 +106,114 @@ def safe_param_name(name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=None)
+def operation_domain(operation_name: str) -> str:
+    """Return the client domain an operation is grouped under."""
+    if "_" in operation_name:
+        return operation_name.split("_")[0]
+    return operation_name[:7]
+
+
+# Buffer size for writing generated files (each is written in one call)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Static parts of the generated models/__init__.py
+_MODELS_INIT_HEADER = '''"""Generated GraphQL models.
+
+Import directly from this package for lazy loading:
+    from cato_gql_client_pkg.generated_client.models import SomeType
+
+Or import everything (slower):
+    from cato_gql_client_pkg.generated_client.models import *
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+'''
+
+_MODELS_INIT_BODY = '''
+# Cache for loaded modules
+_loaded_modules = {}
+_rebuild_done = False
+
+
+def _load_module(name):
+    """Load a submodule and cache it."""
+    if name not in _loaded_modules:
+        _loaded_modules[name] = importlib.import_module(f".{name}", __name__)
+    return _loaded_modules[name]
+
+
+def _rebuild_loaded_models():
+    """Rebuild all loaded models to resolve forward references."""
+    global _rebuild_done
+    if _rebuild_done:
+        return
+
+    # Build namespace with all loaded model modules
+    rebuild_namespace = {}
+    for module_name, module in _loaded_modules.items():
+        rebuild_namespace[module_name] = module
+        # Also add all types from each module
+        for name in dir(module):
+            obj = getattr(module, name, None)
+            if isinstance(obj, type) and issubclass(obj, BaseModel):
+                rebuild_namespace[name] = obj
+
+    # Rebuild incomplete models
+    for module in _loaded_modules.values():
+        for name in dir(module):
+            obj = getattr(module, name, None)
+            if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel:
+                if not getattr(obj, '__pydantic_complete__', True):
+                    try:
+                        obj.model_rebuild(_types_namespace=rebuild_namespace)
+                    except Exception:
+                        pass
+
+    _rebuild_done = True
+
+
+def __getattr__(name):
+    """Lazy import of types from submodules."""
+    # First check if it's a submodule name
+    if name in _SUBMODULES:
+        return _load_module(name)
+
+    # Search for the type in all submodules
+    for submodule_name in _SUBMODULES:
+        try:
+            module = _load_module(submodule_name)
+            if hasattr(module, name):
+                obj = getattr(module, name)
+                # Rebuild models after loading to resolve forward refs
+                if isinstance(obj, type) and issubclass(obj, BaseModel):
+                    _rebuild_loaded_models()
+                return obj
+        except Exception:
+            pass
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List all available names including lazy-loaded types."""
+    names = list(globals().keys())
+    names.extend(_SUBMODULES)
+    # Add all type names from loaded modules
+    for module in _loaded_modules.values():
+        names.extend(n for n in dir(module) if not n.startswith('_'))
+    return sorted(set(names))
+
+
+# Type checking imports for IDE support
+if TYPE_CHECKING:
+'''
+
+
 class CodeGenerator:
     """Generates Python code from GraphQL IR.
 
@@ -108,12 +237,24 @@ class CodeGenerator:
     # Maximum depth for field expansion in queries
     MAX_FIELD_DEPTH = 2
 
+    # Templates rendered by generate(), compiled once per generator
+    TEMPLATE_NAMES = (
+        "scalars.py.j2",
+        "enums.py.j2",
+        "base_client.py.j2",
+        "models.py.j2",
+        "client.py.j2",
+    )
+
     def __init__(
         self,
         ir: IRSchema,
         output_dir: str,
         template_dir: str | None = None,
         is_async: bool = False,
+        verify_output: bool = False,
+        jobs: int = 1,
+        cache_dir: str | None = None,
     ):
         """Initialize the code generator.
 
@@ -124,11 +265,44 @@ class CodeGenerator:
                           Templates here override the built-in templates.
             is_async: If True, generate async clients (async def + await).
                      If False (default), generate sync clients.
+            verify_output: If True, parse every generated .py file with
+                           ast.parse() and raise on syntax errors.
+            jobs: Number of worker processes used to render model and client
+                  files. 1 (default) renders everything in this process.
+            cache_dir: Optional directory for compiled template bytecode,
+                       so later runs skip compiling unchanged templates.
         """
         self.ir = ir
         self.output_dir = output_dir
+        self._models_dir = os.path.join(output_dir, "models")
+        self._clients_dir = os.path.join(output_dir, "clients")
+        # Output directories known to exist, so writes skip makedirs()
+        self._created_dirs: set[str] = set()
         self.template_dir = template_dir
         self.is_async = is_async
+        self.verify_output = verify_output
+        self.jobs = jobs
+        self.cache_dir = cache_dir
+        # (template_name, output_path, context) renders deferred to workers
+        self._pending_files: list[tuple[str, str, dict[str, Any]]] = []
+        # Module names written to models/ and clients/, for the __init__ files
+        self._model_modules: list[str] = []
+        self._client_modules: list[str] = []
+        # Memoized field expansions, keyed by (type_name, depth)
+        self._expand_cache: dict[tuple[str, int], str] = {}
+        # Top-level expansions returned by the expand_fields filter
+        self._filter_cache: dict[str, str] = {}
+        # Types with no sub-selection (scalars + enums) and object-like types
+        self._leaf_types = frozenset(
+            ir.scalars.keys() | ir.enums.keys() | BUILTIN_SCALARS
+        )
+        # Same precedence as IRSchema.get_type_by_name: types shadow inputs
+        # shadow interfaces
+        self._type_index = {**ir.interfaces, **ir.inputs, **ir.types}
+        # Line prefixes for each expansion depth (query body starts at 16 spaces)
+        self._indents = tuple(
+            "\n" + " " * (16 + 4 * d) for d in range(self.MAX_FIELD_DEPTH + 2)
+        )
 
         # Build template-loader-custom templates take precedence
         loaders = []
@@ -138,10 +312,22 @@ class CodeGenerator:
                 loaders.append(FileSystemLoader(str(template_path)))
         loaders.append(PackageLoader("gql_pygen", "templates"))
 
+        # Entries are keyed by template source checksum, so edited or
+        # overriding templates never pick up stale bytecode
+        bytecode_cache = None
+        if cache_dir:
+            bytecode_dir = os.path.join(cache_dir, "jinja")
+            os.makedirs(bytecode_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+
         self.env = Environment(
             loader=ChoiceLoader(loaders),
             autoescape=select_autoescape(),
             keep_trailing_newline=True,
+            # Templates don't change during a run: skip mtime checks
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache,
         )
         # Register custom filters
         self.env.filters["snake_case"] = snake_case
@@ -153,49 +339,86 @@ class CodeGenerator:
         self.env.filters["safe_param"] = safe_param_name
         self.env.filters["expand_fields"] = self._expand_fields_filter
 
+        self._templates = {
+            name: self.env.get_template(name) for name in self.TEMPLATE_NAMES
+        }
+
     def _expand_fields_filter(self, type_name: str) -> str:
         """Jinja2 filter to expand fields for a type."""
-        return self._expand_fields(type_name, depth=0)
+        expanded = self._filter_cache.get(type_name)
+        if expanded is None:
+            expanded = self._filter_cache[type_name] = self._expand_fields(
+                type_name, depth=0
+            )
+        return expanded
 
     def _expand_fields(self, type_name: str, depth: int = 0) -> str:
-        """Recursively expand fields for a type up to MAX_FIELD_DEPTH."""
-        if depth > self.MAX_FIELD_DEPTH:
-            return "__typename"
-
-        # Check if it's a scalar or enum
-        if type_name in self.ir.scalars or type_name in self.ir.enums:
-            return ""
-        if type_name in ["String", "Int", "Float", "Boolean", "ID"]:
-            return ""
-
-        # Find the type
-        ir_type = self.ir.get_type_by_name(type_name)
-        if not ir_type or not hasattr(ir_type, "fields"):
-            return "__typename"
-
-        lines = ["__typename"]
+        """Expand fields for a type up to MAX_FIELD_DEPTH.
+
+        Walks nested types with an explicit stack (children before parents)
+        rather than recursion. Results are memoized per (type_name, depth),
+        since the same nested type is typically reached from many operations.
+        """
+        cache = self._expand_cache
+        leaf_types = self._leaf_types
+        stack = [(type_name, depth, False)]
+
+        while stack:
+            name, level, children_done = stack.pop()
+            key = (name, level)
+            if key in cache:
+                continue
+
+            if level > self.MAX_FIELD_DEPTH:
+                cache[key] = "__typename"
+                continue
+            # Scalars and enums have no sub-selection
+            if name in leaf_types:
+                cache[key] = ""
+                continue
+            ir_type = self._type_index.get(name)
+            if not ir_type:
+                cache[key] = "__typename"
+                continue
+
+            if children_done:
+                cache[key] = self._join_expanded_fields(ir_type, level)
+            else:
+                # Revisit this type once all nested types are expanded
+                stack.append((name, level, True))
+                for field in ir_type.fields:
+                    if field.type_name not in leaf_types:
+                        stack.append((field.type_name, level + 1, False))
+
+        return cache[(type_name, depth)]
+
+    def _join_expanded_fields(self, ir_type, depth: int) -> str:
+        """Assemble a type's selection from already-expanded nested types."""
+        cache = self._expand_cache
+        leaf_types = self._leaf_types
+        indent = self._indents[depth]
+        nested_indent = self._indents[depth + 1]
+        parts = ["__typename"]
         for field in ir_type.fields:
             field_type = field.type_name
-            # Check if a field is a scalar or enum
-            if field_type in self.ir.scalars or field_type in self.ir.enums:
-                lines.append(field.name)
-            elif field_type in ["String", "Int", "Float", "Boolean", "ID"]:
-                lines.append(field.name)
+            if field_type in leaf_types:
+                parts.append(field.name)
             else:
-                # It's a nested object - expand it
-                nested = self._expand_fields(field_type, depth + 1)
+                nested = cache[(field_type, depth + 1)]
                 if nested:
-                    lines.append(f"{field.name} {{\n                {nested}\n            }}")
+                    parts.append(f"{field.name} {{{nested_indent}{nested}{indent}}}")
                 else:
-                    lines.append(field.name)
+                    parts.append(field.name)
 
-        return "\n                ".join(lines)
+        return indent.join(parts)
 
     def generate(self):
         """Generate all code files."""
-        os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.output_dir, "models"), exist_ok=True)
-        os.makedirs(os.path.join(self.output_dir, "clients"), exist_ok=True)
+        for directory in (self.output_dir, self._models_dir, self._clients_dir):
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+        self._model_modules = []
+        self._client_modules = []
 
         # 1. Generate scalars
         self._generate_file(
@@ -211,6 +434,7 @@ class CodeGenerator:
 
         # 3. Generate base client
         self._generate_file("base_client.py.j2", "clients/base_client.py", {})
+        self._client_modules.append("base_client")
 
         # 4. Generate models (modularized by source file)
         self._generate_models()
@@ -218,161 +442,196 @@ class CodeGenerator:
         # 5. Generate clients (grouped by operation domain)
         self._generate_clients()
 
+        # Render any model/client files deferred to worker processes
+        self._flush_pending_files()
+
         # 6. Generate __init__.py files
         self._generate_init_files()
 
+    def _submit_file(
+        self, template_name: str, output_path: str, context: dict[str, Any]
+    ):
+        """Render a file now, or defer it to the worker pool if jobs > 1."""
+        if self.jobs > 1:
+            self._pending_files.append((template_name, output_path, context))
+        else:
+            self._generate_file(template_name, output_path, context)
+
+    def _flush_pending_files(self):
+        """Render all deferred files across a pool of worker processes."""
+        tasks, self._pending_files = self._pending_files, []
+        if not tasks:
+            return
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_worker,
+            initargs=(
+                type(self), self.ir, self.output_dir, self.template_dir,
+                self.is_async, self.verify_output, self.cache_dir,
+            ),
+        ) as executor:
+            # Consume results so worker exceptions propagate here
+            for _ in executor.map(_render_in_worker, tasks):
+                pass
+
     def _generate_file(
         self, template_name: str, output_path: str, context: dict[str, Any]
     ):
         """Render a template and write to a file."""
         # Always inject is_async into context for templates
         context = {**context, "is_async": self.is_async}
-        template = self.env.get_template(template_name)
-        content = template.render(context)
-
-        # Validate Python syntax
-        if output_path.endswith(".py"):
-            try:
-                ast.parse(content)
-            except SyntaxError as e:
-                raise ValueError(
-                    f"Generated invalid Python for {output_path}: {e}\n"
-                    f"Template: {template_name}"
-                )
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._templates[template_name] = self.env.get_template(
+                template_name
+            )
 
         full_path = os.path.join(self.output_dir, output_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, "w") as f:
-            f.write(content)
+        directory = os.path.dirname(full_path)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+        # Without verification the output is never needed as one string, so
+        # stream the rendered chunks to disk instead of building it in memory
+        if not (self.verify_output and output_path.endswith(".py")):
+            self._stream_file(full_path, template.generate(context))
+            return
+
+        content = template.render(context)
+        # Validate Python syntax (opt-in: costs a full parse per file)
+        try:
+            ast.parse(content)
+        except SyntaxError as e:
+            raise ValueError(
+                f"Generated invalid Python for {output_path}: {e}\n"
+                f"Template: {template_name}"
+            )
+        self._write_file(full_path, content)
 
     def _generate_models(self):
-        """Generate model files, organized by source schema file."""
+        """Generate model files, organized by source schema file.
+
+        Types are bucketed by file and their cross-module references are
+        resolved in the same pass, against a global type -> module index.
+        """
         models_by_file: dict[str, dict] = {}
+        # Modules used by each file's rendered code, and every external
+        # (module -> ordered type names) reference it makes
+        used_modules_by_file: defaultdict[str, set[str]] = defaultdict(set)
+        external_deps_by_file: defaultdict[str, dict[str, dict]] = defaultdict(dict)
+
+        # Module name for each schema file, computed once per file
+        self._file_to_base = {
+            file_name: self._module_base_name(file_name)
+            for file_name in set(self.ir.type_to_file.values())
+        }
+        # Scalars and enums live in their own modules and are never qualified
+        type_to_module = {
+            type_name: self._file_to_base[file_name]
+            for type_name, file_name in self.ir.type_to_file.items()
+            if type_name not in self.ir.scalars and type_name not in self.ir.enums
+        }
+        # Interface field mapping for inheritance, cached on the IR
+        interface_fields = self.ir.get_interface_field_names()
 
         for type_name, file_name in self.ir.type_to_file.items():
-            base_name = (
-                file_name.replace(".graphqls", "")
-                .replace(".", "_")
-                .replace("-", "_")
+            base_name = self._file_to_base[file_name]
+            content = models_by_file.get(base_name)
+            if content is None:
+                content = models_by_file[base_name] = {"types": [], "interfaces": []}
+
+            node = (
+                self.ir.types.get(type_name)
+                or self.ir.inputs.get(type_name)
+                or self.ir.interfaces.get(type_name)
+            )
+            if node is None:
+                continue
+            if isinstance(node, IRType):
+                content["types"].append(node)
+            else:
+                content["interfaces"].append(node)
+            self._qualify_references(
+                node, base_name, type_to_module, interface_fields,
+                used_modules_by_file[base_name], external_deps_by_file[base_name],
             )
-            if base_name not in models_by_file:
-                models_by_file[base_name] = {"types": [], "interfaces": []}
-
-            if type_name in self.ir.types:
-                models_by_file[base_name]["types"].append(self.ir.types[type_name])
-            elif type_name in self.ir.inputs:
-                models_by_file[base_name]["types"].append(self.ir.inputs[type_name])
-            elif type_name in self.ir.interfaces:
-                models_by_file[base_name]["interfaces"].append(
-                    self.ir.interfaces[type_name]
-                )
-
-        # Build interface field mapping for inheritance
-        interface_fields = {}
-        for iface in self.ir.interfaces.values():
-            interface_fields[iface.name] = [f.name for f in iface.fields]
 
         for base_name in sorted(models_by_file.keys()):
             content = models_by_file[base_name]
-            self._prepare_model_context(base_name, content, interface_fields)
+            used_modules = used_modules_by_file[base_name]
+            # Only import modules that the rendered code actually references
+            content["external_imports"] = {
+                module: list(type_names)
+                for module, type_names in external_deps_by_file[base_name].items()
+                if module in used_modules
+            }
             content["interface_fields"] = interface_fields
-            self._generate_file("models.py.j2", f"models/{base_name}.py", content)
+            self._submit_file("models.py.j2", f"models/{base_name}.py", content)
+            self._model_modules.append(base_name)
 
-    def _prepare_model_context(
-        self, base_name: str, content: dict, interface_fields: dict
-    ):
-        """Prepare cross-module imports and full type names."""
-        local_types = {t.name for t in content["types"]} | {
-            i.name for i in content["interfaces"]
-        }
-        type_to_module: dict[str, str] = {}
-        external_deps: set[tuple] = set()
-
-        # Find external dependencies
-        for type_name in local_types:
-            for dep in self.ir.dependencies.get(type_name, []):
-                if (
-                    dep not in local_types
-                    and dep not in self.ir.scalars
-                    and dep not in self.ir.enums
-                ):
-                    dep_file = self.ir.type_to_file.get(dep)
-                    if dep_file:
-                        dep_base = (
-                            dep_file.replace(".graphqls", "")
-                            .replace(".", "_")
-                            .replace("-", "_")
-                        )
-                        if dep_base != base_name:
-                            external_deps.add((dep_base, dep))
-                            type_to_module[dep] = dep_base
-
-        # Track which modules are actually used (for external_imports)
-        used_modules: set[str] = set()
-
-        # Set full_type_name and full_interfaces for types
-        for ir_type in content["types"]:
-            ir_type.full_type_name = ir_type.name
-            ir_type.full_interfaces = []
-
-            # Collect inherited field names (these are skipped in output)
-            inherited_field_names: set[str] = set()
-            for iface in ir_type.interfaces:
-                if iface in interface_fields:
-                    inherited_field_names.update(interface_fields[iface])
-
-            for iface in ir_type.interfaces:
-                if iface in type_to_module:
-                    ir_type.full_interfaces.append(f"{type_to_module[iface]}.{iface}")
-                    used_modules.add(type_to_module[iface])
-                else:
-                    ir_type.full_interfaces.append(iface)
-            for field in ir_type.fields:
-                if field.type_name in type_to_module:
-                    field.full_type_name = f"{type_to_module[field.type_name]}.{field.type_name}"
-                    # Only add to used_modules if this field will actually be output
-                    if field.name not in inherited_field_names:
-                        used_modules.add(type_to_module[field.type_name])
-                else:
-                    field.full_type_name = field.type_name
-
-        # Set full_type_name for interfaces
-        for interface in content["interfaces"]:
-            for field in interface.fields:
-                if field.type_name in type_to_module:
-                    field.full_type_name = f"{type_to_module[field.type_name]}.{field.type_name}"
-                    used_modules.add(type_to_module[field.type_name])
-                else:
-                    field.full_type_name = field.type_name
+    @staticmethod
+    def _module_base_name(file_name: str) -> str:
+        """Convert a schema file name to its models module name."""
+        return file_name.replace(".graphqls", "").replace(".", "_").replace("-", "_")
 
-        # Group imports by file - only include modules that are actually used
-        imports_by_file: dict[str, list] = {}
-        for dep_base, dep_type in external_deps:
-            if dep_base in used_modules:
-                if dep_base not in imports_by_file:
-                    imports_by_file[dep_base] = []
-                imports_by_file[dep_base].append(dep_type)
+    @staticmethod
+    def _qualify_references(
+        node: IRType | IRInterface,
+        base_name: str,
+        type_to_module: dict[str, str],
+        interface_fields: dict[str, list[str]],
+        used_modules: set[str],
+        external_deps: dict[str, dict],
+    ):
+        """Set module-qualified names on a type's or interface's references.
 
-        content["external_imports"] = imports_by_file
+        Every reference to a type from another module is recorded in
+        external_deps; modules needed by fields that are actually rendered
+        (i.e. not inherited from an interface) are added to used_modules.
+        """
+        inherited_field_names: set[str] = set()
+        if isinstance(node, IRType):
+            node.full_interfaces = []
+            for iface in node.interfaces:
+                # Inherited fields are skipped in output
+                inherited_field_names.update(interface_fields.get(iface, ()))
+                module = type_to_module.get(iface)
+                if module and module != base_name:
+                    node.full_interfaces.append(f"{module}.{iface}")
+                    used_modules.add(module)
+                    external_deps.setdefault(module, {})[iface] = None
+                else:
+                    node.full_interfaces.append(iface)
+
+        for field in node.fields:
+            type_name = field.type_name
+            module = type_to_module.get(type_name)
+            if module and module != base_name:
+                field.full_type_name = f"{module}.{type_name}"
+                external_deps.setdefault(module, {})[type_name] = None
+                if field.name not in inherited_field_names:
+                    used_modules.add(module)
+            else:
+                field.full_type_name = type_name
 
     def _generate_clients(self):
         """Generate client files grouped by operation domain."""
-        clients: dict[str, list] = {}
+        clients: defaultdict[str, list] = defaultdict(list)
         for op in self.ir.queries + self.ir.mutations:
-            domain = op.name.split("_")[0] if "_" in op.name else op.name[:7]
-            if domain not in clients:
-                clients[domain] = []
-            clients[domain].append(op)
+            clients[operation_domain(op.name)].append(op)
 
         for domain, ops in clients.items():
             # Detect duplicate operation names and suffix mutations to disambiguate
             ops_with_method_names = self._resolve_method_name_conflicts(ops)
             client_name = pascal_case(domain)
-            self._generate_file(
+            module_name = f"{snake_case(domain)}_client"
+            self._submit_file(
                 "client.py.j2",
-                f"clients/{snake_case(domain)}_client.py",
+                f"clients/{module_name}.py",
                 {"client_name": client_name, "operations": ops_with_method_names},
             )
+            self._client_modules.append(module_name)
 
     @staticmethod
     def _resolve_method_name_conflicts(operations: list) -> list[dict]:
@@ -390,12 +649,9 @@ class CodeGenerator:
         result = []
 
         # First pass: group by snake_case name to identify conflicts
-        name_to_ops: dict[str, list] = {}
+        name_to_ops: defaultdict[str, list] = defaultdict(list)
         for op in operations:
-            base_name = snake_case(op.name)
-            if base_name not in name_to_ops:
-                name_to_ops[base_name] = []
-            name_to_ops[base_name].append(op)
+            name_to_ops[snake_case(op.name)].append(op)
 
         # Second pass: assign method names
         for op in operations:
@@ -427,129 +683,76 @@ class CodeGenerator:
     def _generate_init_files(self):
         """Generate __init__.py files for packages."""
         # Root __init__.py
-        with open(os.path.join(self.output_dir, "__init__.py"), "w") as f:
-            f.write('"""Generated GraphQL client package."""\n')
-
-        # models/__init__.py - lazy imports for performance
-        model_files = [
-            f[:-3]  # Remove .py
-            for f in os.listdir(os.path.join(self.output_dir, "models"))
-            if f.endswith(".py") and f != "__init__.py"
-        ]
-        with open(os.path.join(self.output_dir, "models/__init__.py"), "w") as f:
-            f.write('"""Generated GraphQL models.\n\n')
-            f.write('Import directly from this package for lazy loading:\n')
-            f.write('    from cato_gql_client_pkg.generated_client.models import SomeType\n\n')
-            f.write('Or import everything (slower):\n')
-            f.write('    from cato_gql_client_pkg.generated_client.models import *\n')
-            f.write('"""\n\n')
-
-            f.write('import importlib\n')
-            f.write('from typing import TYPE_CHECKING\n\n')
-            f.write('from pydantic import BaseModel\n\n')
-
-            # List of submodules
-            f.write('_SUBMODULES = [\n')
-            for model_file in sorted(model_files):
-                f.write(f'    "{model_file}",\n')
-            f.write(']\n\n')
-
-            # Lazy __getattr__ implementation with model rebuilding
-            f.write('''
-# Cache for loaded modules
-_loaded_modules = {}
-_rebuild_done = False
-
-
-def _load_module(name):
-    """Load a submodule and cache it."""
-    if name not in _loaded_modules:
-        _loaded_modules[name] = importlib.import_module(f".{name}", __name__)
-    return _loaded_modules[name]
-
-
-def _rebuild_loaded_models():
-    """Rebuild all loaded models to resolve forward references."""
-    global _rebuild_done
-    if _rebuild_done:
-        return
-
-    # Build namespace with all loaded model modules
-    rebuild_namespace = {}
-    for module_name, module in _loaded_modules.items():
-        rebuild_namespace[module_name] = module
-        # Also add all types from each module
-        for name in dir(module):
-            obj = getattr(module, name, None)
-            if isinstance(obj, type) and issubclass(obj, BaseModel):
-                rebuild_namespace[name] = obj
-
-    # Rebuild incomplete models
-    for module in _loaded_modules.values():
-        for name in dir(module):
-            obj = getattr(module, name, None)
-            if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel:
-                if not getattr(obj, '__pydantic_complete__', True):
-                    try:
-                        obj.model_rebuild(_types_namespace=rebuild_namespace)
-                    except Exception:
-                        pass
-
-    _rebuild_done = True
-
-
-def __getattr__(name):
-    """Lazy import of types from submodules."""
-    # First check if it's a submodule name
-    if name in _SUBMODULES:
-        return _load_module(name)
-
-    # Search for the type in all submodules
-    for submodule_name in _SUBMODULES:
-        try:
-            module = _load_module(submodule_name)
-            if hasattr(module, name):
-                obj = getattr(module, name)
-                # Rebuild models after loading to resolve forward refs
-                if isinstance(obj, type) and issubclass(obj, BaseModel):
-                    _rebuild_loaded_models()
-                return obj
-        except Exception:
-            pass
-
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
-
+        self._write_file(
+            os.path.join(self.output_dir, "__init__.py"),
+            '"""Generated GraphQL client package."""\n',
+        )
 
-def __dir__():
-    """List all available names including lazy-loaded types."""
-    names = list(globals().keys())
-    names.extend(_SUBMODULES)
-    # Add all type names from loaded modules
-    for module in _loaded_modules.values():
-        names.extend(n for n in dir(module) if not n.startswith('_'))
-    return sorted(set(names))
+        # models/__init__.py - lazy imports for performance. Only modules
+        # written by this run are listed, not stale files in the directory.
+        model_files = sorted(set(self._model_modules))
+        parts = [_MODELS_INIT_HEADER, "_SUBMODULES = [\n"]
+        parts.extend(f'    "{model_file}",\n' for model_file in model_files)
+        parts.append("]\n\n")
+        parts.append(_MODELS_INIT_BODY)
+        # For TYPE_CHECKING block - list all imports for type checkers
+        parts.extend(f"    from .{model_file} import *\n" for model_file in model_files)
+        self._write_file(
+            os.path.join(self._models_dir, "__init__.py"), "".join(parts)
+        )
 
+        # clients/__init__.py - export all clients
+        parts = ['"""Generated GraphQL clients."""\n\n']
+        # Write imports in sorted order to satisfy isort (I001)
+        for client_file in sorted(set(self._client_modules)):
+            if client_file == "base_client":
+                # Use explicit re-export to avoid F401 unused import warning
+                parts.append("from .base_client import GraphQLClient as GraphQLClient\n")
+                parts.append("from .base_client import GraphQLError as GraphQLError\n")
+            else:
+                parts.append(f"from .{client_file} import *\n")
+        self._write_file(
+            os.path.join(self._clients_dir, "__init__.py"), "".join(parts)
+        )
 
-# Type checking imports for IDE support
-if TYPE_CHECKING:
-''')
-            # For TYPE_CHECKING block - list all imports for type checkers
-            for model_file in sorted(model_files):
-                f.write(f'    from .{model_file} import *\n')
+    @staticmethod
+    def _write_file(path: str, content: str):
+        """Write a generated file with a single buffered write."""
+        with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(content)
 
-        # clients/__init__.py - export all clients
-        client_files = [
-            f[:-3]  # Remove .py
-            for f in os.listdir(os.path.join(self.output_dir, "clients"))
-            if f.endswith(".py") and f != "__init__.py"
-        ]
-        with open(os.path.join(self.output_dir, "clients/__init__.py"), "w") as f:
-            f.write('"""Generated GraphQL clients."""\n\n')
-            # Write imports in sorted order to satisfy isort (I001)
-            for client_file in sorted(client_files):
-                if client_file == "base_client":
-                    # Use explicit re-export to avoid F401 unused import warning
-                    f.write("from .base_client import GraphQLClient as GraphQLClient\n")
-                    f.write("from .base_client import GraphQLError as GraphQLError\n")
-                else:
-                    f.write(f"from .{client_file} import *\n")
+    @staticmethod
+    def _stream_file(path: str, chunks: Iterable[str]):
+        """Write a generated file from rendered chunks through one buffer."""
+        with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+
+
+# Per-process generator used by ProcessPoolExecutor workers
+_worker_generator: CodeGenerator | None = None
+
+
+def _init_worker(
+    generator_cls: type[CodeGenerator],
+    ir: IRSchema,
+    output_dir: str,
+    template_dir: str | None,
+    is_async: bool,
+    verify_output: bool,
+    cache_dir: str | None,
+):
+    """Build the worker's generator (Jinja env, filters, caches) once."""
+    global _worker_generator
+    _worker_generator = generator_cls(
+        ir, output_dir,
+        template_dir=template_dir,
+        is_async=is_async,
+        verify_output=verify_output,
+        cache_dir=cache_dir,
+    )
+
+
+def _render_in_worker(task: tuple[str, str, dict[str, Any]]):
+    """Render and write a single file inside a worker process."""
+    template_name, output_path, context = task
+    _worker_generator._generate_file(template_name, output_path, context)
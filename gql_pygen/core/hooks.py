@@ -19,7 +19,9 @@ Example usage:
             return header + content
 """
 
-from typing import Any, Optional, Protocol, runtime_checkable
+from typing import Any, Optional
+
+from typing_extensions import Protocol, runtime_checkable
 
 from .ir import IRSchema
 
@@ -137,29 +139,58 @@ class FilterTypesHook:
 
 
 class HookRunner:
-    """Runs a collection of hooks in order."""
+    """Runs a collection of hooks in order.
+
+    pre_hooks and post_hooks are the hooks that run; add_pre_hook and
+    add_post_hook check that a hook implements its method before adding it.
+    Each hook's method is bound once, when it is added, and bound again
+    only if the lists are changed directly.
+    """
     
     def __init__(self):
         self.pre_hooks: list[PreGenerateHook] = []
         self.post_hooks: list[PostGenerateHook] = []
+        # Bound pre_generate/post_generate methods, with a snapshot of the
+        # hook list they were bound from
+        self._pre_fns: list = []
+        self._pre_bound: list = []
+        self._post_fns: list = []
+        self._post_bound: list = []
     
     def add_pre_hook(self, hook: PreGenerateHook):
         """Add a pre-generation hook."""
+        pre_generate = getattr(hook, "pre_generate", None)
+        if not callable(pre_generate):
+            raise TypeError(f"{hook!r} does not implement pre_generate()")
         self.pre_hooks.append(hook)
+        if self._pre_bound == self.pre_hooks[:-1]:
+            self._pre_fns.append(pre_generate)
+            self._pre_bound.append(hook)
     
     def add_post_hook(self, hook: PostGenerateHook):
         """Add a post-generation hook."""
+        post_generate = getattr(hook, "post_generate", None)
+        if not callable(post_generate):
+            raise TypeError(f"{hook!r} does not implement post_generate()")
         self.post_hooks.append(hook)
+        if self._post_bound == self.post_hooks[:-1]:
+            self._post_fns.append(post_generate)
+            self._post_bound.append(hook)
     
     def run_pre_hooks(self, ir: IRSchema) -> IRSchema:
         """Run all pre-generation hooks in order."""
-        for hook in self.pre_hooks:
-            ir = hook.pre_generate(ir)
+        if self._pre_bound != self.pre_hooks:
+            self._pre_bound = list(self.pre_hooks)
+            self._pre_fns = [hook.pre_generate for hook in self._pre_bound]
+        for pre_generate in self._pre_fns:
+            ir = pre_generate(ir)
         return ir
     
     def run_post_hooks(self, filename: str, content: str) -> str:
         """Run all post-generation hooks in order."""
-        for hook in self.post_hooks:
-            content = hook.post_generate(filename, content)
+        if self._post_bound != self.post_hooks:
+            self._post_bound = list(self.post_hooks)
+            self._post_fns = [hook.post_generate for hook in self._post_bound]
+        for post_generate in self._post_fns:
+            content = post_generate(filename, content)
         return content
-
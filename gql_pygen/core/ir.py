@@ -1,14 +1,23 @@
 """Intermediate Representation (IR) for GraphQL schemas.
 
 This module defines dataclasses that represent GraphQL schema constructs
-in a language-agnostic way, suitable for code generation.
+in a language-agnostic way, suitable for code generation. The per-node
+classes use __slots__, so attributes must be declared as fields before
+being assigned.
 """
 
+import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set
 
+# Word boundaries for camelCase -> snake_case
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
 
-@dataclass
+
+@dataclass(slots=True)
 class IRField:
     """Represents a field in a GraphQL type or interface."""
     name: str
@@ -18,14 +27,19 @@ class IRField:
     description: Optional[str] = None
     arguments: List["IRArgument"] = field(default_factory=list)
     # Runtime-populated by generator for cross-module refs
-    full_type_name: str = ""
+    _full_type_name: Optional[str] = field(default=None, init=False, repr=False)
 
-    def __post_init__(self):
-        if not self.full_type_name:
-            self.full_type_name = self.type_name
+    @property
+    def full_type_name(self) -> str:
+        """Module-qualified type name if set by the generator, else type_name."""
+        return self._full_type_name or self.type_name
 
+    @full_type_name.setter
+    def full_type_name(self, value: str):
+        self._full_type_name = value
 
-@dataclass
+
+@dataclass(slots=True)
 class IRArgument:
     """Represents an argument to a field or operation."""
     name: str
@@ -36,14 +50,14 @@ class IRArgument:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IREnumValue:
     """Represents a single value in a GraphQL enum."""
     name: str
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IREnum:
     """Represents a GraphQL enum type."""
     name: str
@@ -51,7 +65,7 @@ class IREnum:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRType:
     """Represents a GraphQL object type or input type."""
     name: str
@@ -63,7 +77,7 @@ class IRType:
     full_interfaces: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IRInterface:
     """Represents a GraphQL interface type."""
     name: str
@@ -71,19 +85,27 @@ class IRInterface:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IRScalar:
     """Represents a GraphQL scalar type."""
     name: str
     description: Optional[str] = None
 
 
-@dataclass
+# IROperation fields that full_name and all_arguments are computed from
+_OPERATION_DERIVED_FROM = frozenset({"path", "arguments", "parent_arguments"})
+
+
+@dataclass(slots=True)
 class IROperation:
     """Represents a GraphQL query or mutation.
 
     For nested operations (e.g., policy.internetFirewall.addRule),
     the path field contains the full traversal path from the root.
+
+    full_name and all_arguments are computed on first access and reset
+    when path, arguments or parent_arguments is reassigned; changes made
+    to those lists in place are not seen.
     """
     name: str
     operation_type: str  # 'query' or 'mutation'
@@ -96,6 +118,17 @@ class IROperation:
     path: List[str] = field(default_factory=list)
     # Arguments collected from parent namespace fields (e.g., accountId from policy(accountId))
     parent_arguments: List[IRArgument] = field(default_factory=list)
+    # Derived values, see full_name and all_arguments
+    _full_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _all_arguments: Optional[List[IRArgument]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in _OPERATION_DERIVED_FROM:
+            object.__setattr__(self, "_full_name", None)
+            object.__setattr__(self, "_all_arguments", None)
+        object.__setattr__(self, name, value)
 
     def __post_init__(self):
         # If path is empty, set it to just the operation name
@@ -105,24 +138,42 @@ class IROperation:
     @property
     def full_name(self) -> str:
         """Return underscore-joined path for method names, e.g., 'policy_internet_firewall_add_rule'."""
-        return "_".join(self._to_snake_case(p) for p in self.path)
+        full_name = self._full_name
+        if full_name is None:
+            full_name = self._full_name = "_".join(self._to_snake_case(p) for p in self.path)
+        return full_name
 
     @property
     def all_arguments(self) -> List[IRArgument]:
-        """Return all arguments including parent namespace arguments."""
-        return self.parent_arguments + self.arguments
+        """Return all arguments including parent namespace arguments (shared list)."""
+        all_arguments = self._all_arguments
+        if all_arguments is None:
+            all_arguments = self._all_arguments = self.parent_arguments + self.arguments
+        return all_arguments
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _to_snake_case(name: str) -> str:
         """Convert camelCase to snake_case."""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        s1 = _CAMEL_WORD_RE.sub(r'\1_\2', name)
+        return _CAMEL_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
+
+
+_INDEXED_FIELDS = frozenset({"types", "inputs", "interfaces"})
+_NAMESPACE_SUFFIXES = ("Mutations", "Queries")
 
 
 @dataclass
 class IRSchema:
-    """Complete intermediate representation of a GraphQL schema."""
+    """Complete intermediate representation of a GraphQL schema.
+
+    Unlike the per-node classes above this one keeps a __dict__, so that
+    pre-generation hooks can attach their own metadata to the schema.
+
+    Name lookups and interface field names go through indexes that are
+    rebuilt whenever types, inputs or interfaces is reassigned; entries
+    added in place after the first lookup are not seen until then.
+    """
     scalars: Dict[str, IRScalar] = field(default_factory=dict)
     enums: Dict[str, IREnum] = field(default_factory=dict)
     types: Dict[str, IRType] = field(default_factory=dict)
@@ -135,23 +186,48 @@ class IRSchema:
     type_to_file: Dict[str, str] = field(default_factory=dict)
     dependencies: Dict[str, Set[str]] = field(default_factory=dict)
 
+    # Merged lookup index over types, inputs and interfaces, built on first use
+    _all_types: Optional[Dict[str, IRType | IRInterface]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Interface name -> field names, built on first use
+    _interface_fields: Optional[Dict[str, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value) -> None:
+        # Hooks replace these collections wholesale, so drop the stale indexes
+        if name in _INDEXED_FIELDS:
+            object.__setattr__(self, "_all_types", None)
+            object.__setattr__(self, "_interface_fields", None)
+        object.__setattr__(self, name, value)
+
+    def _type_index(self) -> Dict[str, IRType | IRInterface]:
+        index = self._all_types
+        if index is None:
+            # Later entries win, so types shadow inputs shadow interfaces
+            index = {**self.interfaces, **self.inputs, **self.types}
+            self._all_types = index
+        return index
+
     def get_type_by_name(self, name: str) -> Optional[IRType | IRInterface]:
         """Look up a type or interface by name."""
-        if name in self.types:
-            return self.types[name]
-        if name in self.inputs:
-            return self.inputs[name]
-        if name in self.interfaces:
-            return self.interfaces[name]
-        return None
-
-    def get_all_types(self) -> Dict[str, IRType | IRInterface]:
-        """Return all types and interfaces."""
-        result = {}
-        result.update(self.types)
-        result.update(self.inputs)
-        result.update(self.interfaces)
-        return result
+        return self._type_index().get(name)
+
+    def get_all_types(self) -> Mapping[str, IRType | IRInterface]:
+        """Return all types and interfaces (read-only view)."""
+        return MappingProxyType(self._type_index())
+
+    def get_interface_field_names(self) -> Dict[str, List[str]]:
+        """Return interface name -> its field names (shared, do not modify)."""
+        interface_fields = self._interface_fields
+        if interface_fields is None:
+            interface_fields = {
+                iface.name: [f.name for f in iface.fields]
+                for iface in self.interfaces.values()
+            }
+            self._interface_fields = interface_fields
+        return interface_fields
 
     @property
     def all_operations(self) -> List[IROperation]:
@@ -160,5 +236,5 @@ class IRSchema:
 
     def is_namespace_type(self, type_name: str) -> bool:
         """Check if a type is a namespace type (ends with Mutations or Queries)."""
-        return type_name.endswith("Mutations") or type_name.endswith("Queries")
+        return type_name.endswith(_NAMESPACE_SUFFIXES)
 
@@ -4,13 +4,30 @@ Parses .graphqls files and produces an IRSchema.
 """
 
 import os
-from typing import Any, Dict, List, Union
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from sys import intern
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from graphql import (
+    DocumentNode,
     EnumTypeDefinitionNode,
     InputObjectTypeDefinitionNode,
     InterfaceTypeDefinitionNode,
     ListTypeNode,
+    NamedTypeNode,
     NonNullTypeNode,
     ObjectTypeDefinitionNode,
     ObjectTypeExtensionNode,
@@ -18,6 +35,15 @@ from graphql import (
     parse,
 )
 
+from .cache import (
+    document_cache_key,
+    load_cached_document,
+    load_cached_ir,
+    save_cached_document,
+    save_cached_ir,
+    schema_cache_key,
+    source_cache_key,
+)
 from .ir import (
     IRArgument,
     IREnum,
@@ -30,81 +56,218 @@ from .ir import (
     IRType,
 )
 
+# Root types whose fields are operations rather than model fields
+_OPERATION_ROOTS = frozenset({"Query", "Mutation"})
+
+
+class TypeInfo(NamedTuple):
+    """A field or argument type with its list/nullability wrappers removed."""
+    name: str
+    is_list: bool
+    is_optional: bool
+
+
+def parse_document(content: str, cache_dir: Optional[str] = None) -> DocumentNode:
+    """Parse one file's schema text, reusing a cached document if any.
+
+    Module-level so that it can run in a ProcessPoolExecutor worker.
+    """
+    if not cache_dir:
+        return parse(content, no_location=True)
+    key = document_cache_key(content)
+    document = load_cached_document(cache_dir, key)
+    if document is None:
+        # Locations aren't used by the IR and would bloat the cache
+        document = parse(content, no_location=True)
+        save_cached_document(cache_dir, key, document)
+    return document
+
+
+def _read_schema_file(file_path: str) -> str:
+    """Read one schema file."""
+    # Explicit UTF-8 (the GraphQL source encoding) skips locale lookup
+    return Path(file_path).read_text(encoding="utf-8")
+
 
 class SchemaParser:
     """Parses GraphQL schema files into IR."""
 
-    def __init__(self, schema_path: str):
-        """Initialize parser with path to schema file or directory."""
+    # Below this many files, worker start-up costs more than it saves
+    MIN_FILES_PER_POOL = 4
+    # Threads reading schema files ahead of the parser
+    READ_AHEAD_THREADS = 4
+
+    def __init__(
+        self, schema_path: str, cache_dir: Optional[str] = None, jobs: int = 1
+    ):
+        """Initialize parser with path to schema file or directory.
+
+        Args:
+            schema_path: Path to a .graphqls file or a directory of them
+            cache_dir: Optional directory for caching the parsed IR between
+                       runs. The cache is keyed by the schema files' paths,
+                       sizes and modification times.
+            jobs: Number of worker processes used to parse schema files.
+                  1 (default) parses everything in this process.
+        """
         self.schema_path = schema_path
+        self.cache_dir = cache_dir
+        self.jobs = jobs
         self.ir = IRSchema()
         self.current_file = ""
+        # Field names of object types that definitions/extensions were merged
+        # into, kept up to date by _add_unique_fields
+        self._field_names: Dict[str, Set[str]] = {}
+        # In-memory (file name, content) pairs; set by from_sources()
+        self._sources: Optional[List[Tuple[str, str]]] = None
+        # Top-level definition node class -> handler, used by _process_ast
+        self._definition_handlers = {
+            ScalarTypeDefinitionNode: self._process_scalar,
+            EnumTypeDefinitionNode: self._process_enum,
+            InterfaceTypeDefinitionNode: self._process_interface,
+            ObjectTypeDefinitionNode: self._process_object_type,
+            # Handle 'extend type Query/Mutation' as operations
+            ObjectTypeExtensionNode: self._process_object_extension,
+            InputObjectTypeDefinitionNode: self._process_input_type,
+        }
+
+    @classmethod
+    def from_sources(
+        cls,
+        sources: Iterable[Tuple[str, str]],
+        cache_dir: Optional[str] = None,
+        jobs: int = 1,
+    ) -> "SchemaParser":
+        """Create a parser over in-memory schema sources instead of a path.
+
+        Args:
+            sources: (file name, schema text) pairs, e.g. read straight out of
+                     an archive. They are parsed in file name order.
+            cache_dir: Optional IR cache directory; entries are keyed by the
+                       sources' names and contents.
+            jobs: Number of worker processes used to parse the sources.
+        """
+        parser = cls("", cache_dir=cache_dir, jobs=jobs)
+        parser._sources = sorted(sources)
+        return parser
 
     def parse_all(self) -> IRSchema:
         """Parse all schema files and return the complete IR."""
-        schema_files = self._collect_schema_files()
-
-        for file_path in schema_files:
-            self.current_file = os.path.basename(file_path)
-            with open(file_path) as f:
-                content = f.read()
-                try:
-                    ast = parse(content)
-                    self._process_ast(ast)
-                except Exception as e:
-                    print(f"Error parsing {self.current_file}: {e}")
-                    raise
+        cache_key = None
+        if self._sources is not None:
+            sources: Iterable[Tuple[str, str]] = self._sources
+            file_count = len(self._sources)
+            if self.cache_dir:
+                cache_key = source_cache_key(self._sources)
+        else:
+            schema_files = self._collect_schema_files()
+            sources = self._read_schema_files(schema_files)
+            if self.cache_dir:
+                cache_key = schema_cache_key(self.schema_path, schema_files)
+            file_count = len(schema_files)
+
+        if cache_key:
+            cached = load_cached_ir(self.cache_dir, cache_key)
+            if cached is not None:
+                self.ir = cached
+                return self.ir
+
+        if self.jobs > 1 and file_count >= self.MIN_FILES_PER_POOL:
+            # Parse in workers, but build the IR here in file order
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                futures = [
+                    (file_name, executor.submit(parse_document, content, self.cache_dir))
+                    for file_name, content in sources
+                ]
+                self._process_sources(futures)
+        else:
+            self._process_sources(
+                (file_name, partial(parse_document, content, self.cache_dir))
+                for file_name, content in sources
+            )
 
         self._resolve_dependencies()
         # Discover nested operations after all types are parsed
         self._discover_nested_operations()
+
+        if cache_key:
+            save_cached_ir(self.cache_dir, cache_key, self.ir)
         return self.ir
 
+    def _process_sources(self, documents: Iterable[Tuple[str, Any]]):
+        """Add each (file name, pending document) to the IR, in order.
+
+        A pending document is a Future or a zero-argument callable, so that
+        parse errors surface here and are reported against their file.
+        """
+        for file_name, pending in documents:
+            self.current_file = os.path.basename(file_name)
+            try:
+                if isinstance(pending, Future):
+                    ast = pending.result()
+                else:
+                    ast = pending()
+                self._process_ast(ast)
+            except Exception as e:
+                print(f"Error parsing {self.current_file}: {e}")
+                raise
+
+    @classmethod
+    def _read_schema_files(cls, schema_files: List[str]) -> Iterator[Tuple[str, str]]:
+        """Yield (path, content) for each schema file, in order.
+
+        Nothing is read until the first item is requested (a cache hit
+        never reads). With several files, reads run on a few threads so
+        the next files load while the current one is parsed.
+        """
+        if len(schema_files) < cls.MIN_FILES_PER_POOL:
+            for file_path in schema_files:
+                yield file_path, _read_schema_file(file_path)
+            return
+        with ThreadPoolExecutor(max_workers=cls.READ_AHEAD_THREADS) as pool:
+            yield from zip(schema_files, pool.map(_read_schema_file, schema_files))
+
     def _collect_schema_files(self) -> List[str]:
         """Collect all .graphqls files from path."""
-        files = []
         if os.path.isfile(self.schema_path):
-            if self.schema_path.endswith(".graphqls"):
-                files.append(self.schema_path)
-        else:
-            for root, _, filenames in os.walk(self.schema_path):
-                for filename in filenames:
-                    if filename.endswith(".graphqls"):
-                        files.append(os.path.join(root, filename))
-        return sorted(files)
+            return [self.schema_path] if self.schema_path.endswith(".graphqls") else []
+        files: List[str] = []
+        # Walk with scandir directly: DirEntry carries the file type, so
+        # only directories cost an extra call, and only matches are kept
+        pending = [self.schema_path] if os.path.isdir(self.schema_path) else []
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".graphqls"):
+                        files.append(entry.path)
+        files.sort()
+        return files
 
     def _resolve_dependencies(self):
         """Track type dependencies for cross-module imports."""
-        all_types = {**self.ir.types, **self.ir.inputs, **self.ir.interfaces}
-        for type_name, ir_type in all_types.items():
-            deps = set()
-            if hasattr(ir_type, "fields"):
-                for field in ir_type.fields:
-                    deps.add(field.type_name)
-            if hasattr(ir_type, "interfaces"):
-                for interface in ir_type.interfaces:
-                    deps.add(interface)
-            self.ir.dependencies[type_name] = deps
+        dependencies = self.ir.dependencies
+        for types in (self.ir.types, self.ir.inputs):
+            for type_name, ir_type in types.items():
+                deps = {field.type_name for field in ir_type.fields}
+                deps.update(ir_type.interfaces)
+                dependencies[type_name] = deps
+        # Interfaces don't implement other interfaces in the IR
+        for type_name, interface in self.ir.interfaces.items():
+            dependencies[type_name] = {field.type_name for field in interface.fields}
 
     def _process_ast(self, ast):
         """Process GraphQL AST and populate IR."""
+        handlers = self._definition_handlers
         for definition in ast.definitions:
-            if isinstance(definition, ScalarTypeDefinitionNode):
-                self._process_scalar(definition)
-            elif isinstance(definition, EnumTypeDefinitionNode):
-                self._process_enum(definition)
-            elif isinstance(definition, InterfaceTypeDefinitionNode):
-                self._process_interface(definition)
-            elif isinstance(definition, ObjectTypeDefinitionNode):
-                self._process_object_type(definition)
-            elif isinstance(definition, ObjectTypeExtensionNode):
-                # Handle 'extend type Query/Mutation' as operations
-                self._process_object_extension(definition)
-            elif isinstance(definition, InputObjectTypeDefinitionNode):
-                self._process_input_type(definition)
+            # Exact-type lookup; other definitions (directives, schema) are skipped
+            handler = handlers.get(type(definition))
+            if handler is not None:
+                handler(definition)
 
     def _process_scalar(self, node: ScalarTypeDefinitionNode):
-        name = node.name.value
+        name = intern(node.name.value)
         self.ir.scalars[name] = IRScalar(
             name=name,
             description=node.description.value if node.description else None,
@@ -112,7 +275,7 @@ class SchemaParser:
         self.ir.type_to_file[name] = self.current_file
 
     def _process_enum(self, node: EnumTypeDefinitionNode):
-        name = node.name.value
+        name = intern(node.name.value)
         values = [
             IREnumValue(
                 name=v.name.value,
@@ -128,7 +291,7 @@ class SchemaParser:
         self.ir.type_to_file[name] = self.current_file
 
     def _process_interface(self, node: InterfaceTypeDefinitionNode):
-        name = node.name.value
+        name = intern(node.name.value)
         fields = self._process_fields(node.fields)
         self.ir.interfaces[name] = IRInterface(
             name=name,
@@ -138,21 +301,18 @@ class SchemaParser:
         self.ir.type_to_file[name] = self.current_file
 
     def _process_object_type(self, node: ObjectTypeDefinitionNode):
-        name = node.name.value
-        if name in ("Query", "Mutation"):
+        name = intern(node.name.value)
+        if name in _OPERATION_ROOTS:
             self._process_operations(node)
         else:
             fields = self._process_fields(node.fields)
-            interfaces = [i.name.value for i in node.interfaces]
+            interfaces = [intern(i.name.value) for i in node.interfaces]
 
             # Check if type already exists (from earlier extension processing)
             if name in self.ir.types:
                 existing = self.ir.types[name]
                 # Merge: add base fields + description, keep existing extension fields
-                existing_names = {f.name for f in existing.fields}
-                for field in fields:
-                    if field.name not in existing_names:
-                        existing.fields.append(field)
+                self._add_unique_fields(existing, fields)
                 # Update metadata from the base type definition
                 existing.interfaces = interfaces
                 if node.description:
@@ -167,7 +327,7 @@ class SchemaParser:
             self.ir.type_to_file[name] = self.current_file
 
     def _process_input_type(self, node: InputObjectTypeDefinitionNode):
-        name = node.name.value
+        name = intern(node.name.value)
         fields = self._process_fields(node.fields)
         self.ir.inputs[name] = IRType(
             name=name,
@@ -184,7 +344,7 @@ class SchemaParser:
         For other types: merges fields into the existing type definition.
         """
         name = node.name.value
-        if name in ("Query", "Mutation"):
+        if name in _OPERATION_ROOTS:
             self._process_operations(node)
         else:
             # Merge extension fields into existing type
@@ -200,13 +360,7 @@ class SchemaParser:
 
         # Check if type already exists
         if type_name in self.ir.types:
-            existing_type = self.ir.types[type_name]
-            # Track existing field names to avoid duplicates
-            existing_names = {f.name for f in existing_type.fields}
-            for field in extension_fields:
-                if field.name not in existing_names:
-                    existing_type.fields.append(field)
-                    existing_names.add(field.name)
+            self._add_unique_fields(self.ir.types[type_name], extension_fields)
         else:
             # Type doesn't exist yet, create it
             self.ir.types[type_name] = IRType(
@@ -216,21 +370,39 @@ class SchemaParser:
             )
             self.ir.type_to_file[type_name] = self.current_file
 
+    def _add_unique_fields(self, ir_type: IRType, fields: List[IRField]):
+        """Append the fields whose names ir_type doesn't have yet.
+
+        The type's field-name set is built on the first merge and then
+        maintained here, instead of being rebuilt for every extension.
+        """
+        names = self._field_names.get(ir_type.name)
+        if names is None:
+            names = self._field_names[ir_type.name] = {f.name for f in ir_type.fields}
+        for field in fields:
+            if field.name not in names:
+                ir_type.fields.append(field)
+                names.add(field.name)
+
     def _process_fields(self, field_nodes) -> List[IRField]:
-        """Process field definitions into IRField list."""
+        """Process field definitions into IRField list.
+
+        Field and argument names recur across types (id, name, input, ...),
+        so they are interned like type names.
+        """
         fields = []
         for node in field_nodes:
-            type_info = self._get_type_info(node.type)
+            type_name, is_list, is_optional = self._get_type_info(node.type)
             args = []
             if hasattr(node, "arguments") and node.arguments:
                 for arg_node in node.arguments:
-                    arg_type_info = self._get_type_info(arg_node.type)
+                    arg_type_name, arg_is_list, arg_is_optional = self._get_type_info(arg_node.type)
                     args.append(
                         IRArgument(
-                            name=arg_node.name.value,
-                            type_name=arg_type_info["name"],
-                            is_list=arg_type_info["is_list"],
-                            is_optional=arg_type_info["is_optional"],
+                            name=intern(arg_node.name.value),
+                            type_name=arg_type_name,
+                            is_list=arg_is_list,
+                            is_optional=arg_is_optional,
                             description=arg_node.description.value
                             if arg_node.description
                             else None,
@@ -238,10 +410,10 @@ class SchemaParser:
                     )
             fields.append(
                 IRField(
-                    name=node.name.value,
-                    type_name=type_info["name"],
-                    is_list=type_info["is_list"],
-                    is_optional=type_info["is_optional"],
+                    name=intern(node.name.value),
+                    type_name=type_name,
+                    is_list=is_list,
+                    is_optional=is_optional,
                     description=node.description.value if node.description else None,
                     arguments=args,
                 )
@@ -254,16 +426,16 @@ class SchemaParser:
         """Process Query or Mutation type into operations."""
         op_type = "query" if node.name.value == "Query" else "mutation"
         for field in node.fields:
-            type_info = self._get_type_info(field.type)
+            type_name, is_list, is_optional = self._get_type_info(field.type)
             args = []
             for arg_node in field.arguments:
-                arg_type_info = self._get_type_info(arg_node.type)
+                arg_type_name, arg_is_list, arg_is_optional = self._get_type_info(arg_node.type)
                 args.append(
                     IRArgument(
-                        name=arg_node.name.value,
-                        type_name=arg_type_info["name"],
-                        is_list=arg_type_info["is_list"],
-                        is_optional=arg_type_info["is_optional"],
+                        name=intern(arg_node.name.value),
+                        type_name=arg_type_name,
+                        is_list=arg_is_list,
+                        is_optional=arg_is_optional,
                         description=arg_node.description.value
                         if arg_node.description
                         else None,
@@ -273,9 +445,9 @@ class SchemaParser:
                 name=field.name.value,
                 operation_type=op_type,
                 arguments=args,
-                return_type=type_info["name"],
-                is_return_list=type_info["is_list"],
-                is_return_optional=type_info["is_optional"],
+                return_type=type_name,
+                is_return_list=is_list,
+                is_return_optional=is_optional,
                 description=field.description.value if field.description else None,
             )
             if op_type == "query":
@@ -283,35 +455,20 @@ class SchemaParser:
             else:
                 self.ir.mutations.append(op)
 
-    def _get_type_info(self, type_node) -> Dict[str, Any]:
-        """Extract type name, is_list, and is_optional from type node."""
-        is_optional = True
+    @staticmethod
+    def _get_type_info(type_node) -> TypeInfo:
+        """Extract type name, is_list, and is_optional from a type node."""
+        # Only an outermost NonNull wrapper makes the value required
+        is_optional = not isinstance(type_node, NonNullTypeNode)
         is_list = False
-
-        # NonNull wrapper means not optional
-        if isinstance(type_node, NonNullTypeNode):
-            is_optional = False
+        # Peel NonNull and List wrappers, e.g. [Type!]! or [[Type]]
+        while not isinstance(type_node, NamedTypeNode):
+            if isinstance(type_node, ListTypeNode):
+                is_list = True
             type_node = type_node.type
-
-        # List wrapper
-        if isinstance(type_node, ListTypeNode):
-            is_list = True
-            type_node = type_node.type
-            # Handle non-null inside list [Type!]
-            if isinstance(type_node, NonNullTypeNode):
-                type_node = type_node.type
-
-        # Handle nested lists [[Type]] (rare but possible)
-        if isinstance(type_node, ListTypeNode):
-            type_node = type_node.type
-            if isinstance(type_node, NonNullTypeNode):
-                type_node = type_node.type
-
-        return {
-            "name": type_node.name.value,
-            "is_list": is_list,
-            "is_optional": is_optional,
-        }
+        # Type names recur across the schema: intern them so the IR shares
+        # one string per name and set/dict lookups can match by identity
+        return TypeInfo(intern(type_node.name.value), is_list, is_optional)
 
     def _discover_nested_operations(self):
         """Discover nested operations in namespace types.
@@ -360,7 +517,12 @@ class SchemaParser:
         parent_args: List[IRArgument],
         results: List[IROperation]
     ):
-        """Recursively traverse a namespace type to find operations.
+        """Traverse a namespace type and its nested namespaces to find operations.
+
+        Walks depth-first with an explicit stack of field iterators, so
+        operations come out in the same order as a recursive walk. A field
+        leading back to a namespace already on the current path is skipped,
+        so cyclic namespaces terminate.
 
         Args:
             type_name: The namespace type to explore (e.g., PolicyMutations)
@@ -369,25 +531,37 @@ class SchemaParser:
             parent_args: Arguments accumulated from parent namespaces
             results: List to append discovered operations to
         """
-        type_def = self.ir.types.get(type_name)
+        types = self.ir.types
+        is_namespace_type = self.ir.is_namespace_type
+        type_def = types.get(type_name)
         if not type_def:
             return
 
-        for field in type_def.fields:
-            field_path = path + [field.name]
+        # (namespace type, remaining fields, path, accumulated args) per level
+        stack = [(type_name, iter(type_def.fields), path, parent_args)]
+        # Namespace types on the current path, to break cycles
+        on_path = {type_name}
+        while stack:
+            _, fields, path, parent_args = stack[-1]
+            for field in fields:
+                field_path = path + [field.name]
+
+                if is_namespace_type(field.type_name):
+                    # This is another namespace - descend into it, then
+                    # resume this level's remaining fields afterwards.
+                    # Accumulate any arguments from this field
+                    nested = types.get(field.type_name)
+                    if nested and field.type_name not in on_path:
+                        on_path.add(field.type_name)
+                        stack.append((
+                            field.type_name,
+                            iter(nested.fields),
+                            field_path,
+                            parent_args + field.arguments,
+                        ))
+                        break
+                    continue
 
-            if self.ir.is_namespace_type(field.type_name):
-                # This is another namespace - recurse deeper
-                # Accumulate any arguments from this field
-                accumulated_args = parent_args + field.arguments
-                self._traverse_namespace(
-                    type_name=field.type_name,
-                    op_type=op_type,
-                    path=field_path,
-                    parent_args=accumulated_args,
-                    results=results
-                )
-            else:
                 # This is a leaf operation (returns a non-namespace type)
                 # Only include if it has arguments or returns a meaningful type
                 # (skip placeholder fields)
@@ -406,4 +580,7 @@ class SchemaParser:
                     parent_arguments=list(parent_args),  # Copy to avoid mutation
                 )
                 results.append(op)
+            else:
+                # This level is exhausted
+                on_path.discard(stack.pop()[0])
 
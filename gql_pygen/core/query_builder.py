@@ -4,12 +4,19 @@ Constructs GraphQL query/mutation strings from operation metadata,
 with support for field selection.
 """
 
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Set, Tuple
 
 from .ir import IRField, IROperation, IRSchema, IRType
 
+# "$" that starts a variable name in a built query
+_VARIABLE_RE = re.compile(r"\$(?=[_A-Za-z])")
+# Field tree that selects every field of a type, see _build_field_tree
+_SELECT_ALL: Dict[str, Any] = {"*": True}
+
 
 class FieldSelectionMode(Enum):
     """Field selection modes for queries."""
@@ -18,21 +25,29 @@ class FieldSelectionMode(Enum):
     CUSTOM = "custom"    # User-specified fields
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FieldSelection:
-    """Configuration for which fields to include in a query."""
+    """Configuration for which fields to include in a query.
+
+    Immutable and hashable, so a selection can key the query caches
+    directly. custom_fields is stored as a tuple.
+    """
     mode: FieldSelectionMode = FieldSelectionMode.ALL
-    custom_fields: List[str] = field(default_factory=list)
+    custom_fields: Tuple[str, ...] = ()
     max_depth: int = 10  # Prevent infinite recursion
     
     # Predefined selections
-    ALL: "FieldSelection" = None  # Set below
-    MINIMAL: "FieldSelection" = None  # Set below
+    ALL: ClassVar["FieldSelection"]  # Set below
+    MINIMAL: ClassVar["FieldSelection"]  # Set below
+
+    def __post_init__(self):
+        if type(self.custom_fields) is not tuple:
+            object.__setattr__(self, "custom_fields", tuple(self.custom_fields))
     
     @classmethod
     def select(cls, *fields: str) -> "FieldSelection":
         """Create a custom field selection."""
-        return cls(mode=FieldSelectionMode.CUSTOM, custom_fields=list(fields))
+        return cls(mode=FieldSelectionMode.CUSTOM, custom_fields=fields)
 
 
 # Initialize class-level constants
@@ -46,20 +61,25 @@ class QueryBuilder:
     def __init__(self, schema: IRSchema):
         """Initialize with schema for type lookups."""
         self.schema = schema
-        self._query_cache: Dict[str, str] = {}
-        # Types that are considered scalars (no subfields)
-        self._scalar_types = {
+        # Built queries by (operation type, full name, field selection)
+        self._query_cache: Dict[Tuple[str, str, FieldSelection], str] = {}
+        # (operation, variable mapping, declarations) by id(operation); the
+        # operation is kept so that its id can't be reused while cached
+        self._variables_cache: Dict[int, Tuple[IROperation, List[tuple], str]] = {}
+        # "  " * depth for each depth, grown on demand by _ensure_indents
+        self._indents: List[str] = [""]
+        # ALL-mode selections by (type name, depth, max depth, visited types)
+        self._all_fields_cache: Dict[Tuple[str, int, int, frozenset], Tuple[str, ...]] = {}
+        # Types that are considered scalars (no subfields): the built-ins,
+        # schema-defined scalars and enums. Checked inline in the recursion.
+        self._scalar_types = frozenset({
             "String", "Int", "Float", "Boolean", "ID",
             # Custom scalars from Cato schema
             "DateTime", "Date", "Time", "JSON", "Long", "Any",
             "IPAddress", "Asn", "Domain", "Email", "Fqdn",
             "GlobalIPRange", "Hostname", "IPSubnet", "Mac",
             "Port", "SID", "Sha256", "Url", "CountryCode",
-        }
-        # Add schema-defined scalars
-        self._scalar_types.update(schema.scalars.keys())
-        # Add enums as scalars (no subfields)
-        self._scalar_types.update(schema.enums.keys())
+        }.union(schema.scalars, schema.enums))
     
     def build(
         self,
@@ -75,15 +95,16 @@ class QueryBuilder:
         Returns:
             Complete GraphQL query string
         """
-        cache_key = f"{operation.full_name}:{fields.mode.value}"
-        if cache_key in self._query_cache and fields.mode != FieldSelectionMode.CUSTOM:
-            return self._query_cache[cache_key]
+        cache_key = (operation.operation_type, operation.full_name, fields)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Build variable declarations
-        var_decls = self._build_variable_declarations(operation)
+        # Variable names are shared by the declarations and the body
+        var_mapping, var_decls = self._get_variables(operation)
         
         # Build the nested field path
-        body = self._build_operation_body(operation, fields)
+        body = self._build_operation_body(operation, fields, var_mapping)
         
         # Assemble the query
         op_type = operation.operation_type
@@ -91,16 +112,76 @@ class QueryBuilder:
         
         query = f"{op_type} {op_name}({var_decls}) {{\n{body}\n}}"
         
-        # Cache if not custom
-        if fields.mode != FieldSelectionMode.CUSTOM:
-            self._query_cache[cache_key] = query
+        self._query_cache[cache_key] = query
         
         return query
     
-    def _build_variable_declarations(self, operation: IROperation) -> str:
+    def build_batch(
+        self,
+        operations: List[Tuple[IROperation, FieldSelection]],
+    ) -> str:
+        """Build one document that runs several operations in a single request.
+
+        Operation i's root field is aliased ``b{i}`` and its variables are
+        renamed ``$b{i}_<name>``, so the same operation may appear more than
+        once. Use batch_alias() and batch_variable() to map values in and out.
+
+        Args:
+            operations: (operation, field selection) pairs, all queries or
+                        all mutations
+
+        Returns:
+            Complete GraphQL document string
+        """
+        op_types = {operation.operation_type for operation, _ in operations}
+        if len(op_types) != 1:
+            raise ValueError("A batch must contain only queries or only mutations")
+
+        decls = []
+        bodies = []
+        for index, (operation, fields) in enumerate(operations):
+            prefix = f"${self.batch_alias(index)}_"
+            var_mapping, var_decls = self._get_variables(operation)
+            if var_decls:
+                decls.append(_VARIABLE_RE.sub(prefix, var_decls))
+            body = _VARIABLE_RE.sub(
+                prefix, self._build_operation_body(operation, fields, var_mapping)
+            )
+            # The root field is the first line, indented one level
+            bodies.append(f"  {self.batch_alias(index)}: {body[2:]}")
+
+        var_decls = f"({', '.join(decls)})" if decls else ""
+        body = "\n".join(bodies)
+        return f"{op_types.pop()} Batch{var_decls} {{\n{body}\n}}"
+
+    @staticmethod
+    def batch_alias(index: int) -> str:
+        """Response key of the index-th operation in a build_batch() document."""
+        return f"b{index}"
+
+    @classmethod
+    def batch_variable(cls, index: int, var_name: str) -> str:
+        """Variable name of var_name for the index-th batched operation."""
+        return f"{cls.batch_alias(index)}_{var_name}"
+
+    def _get_variables(self, operation: IROperation) -> Tuple[List[tuple], str]:
+        """Return the operation's variable mapping and declarations.
+
+        Both only depend on the operation's arguments, so they are cached
+        per operation object and shared by every selection mode and batch
+        the operation is built in. The mapping is keyed by argument
+        identity, so it must not be shared with other operation objects.
+        """
+        cached = self._variables_cache.get(id(operation))
+        if cached is None:
+            var_mapping = self._get_variable_mapping(operation)
+            cached = (operation, var_mapping, self._build_variable_declarations(var_mapping))
+            self._variables_cache[id(operation)] = cached
+        return cached[1], cached[2]
+
+    def _build_variable_declarations(self, var_mapping: List[tuple]) -> str:
         """Build the variable declaration part: ($accountId: ID!, $input: SomeInput!)"""
         decls = []
-        var_mapping = self._get_variable_mapping(operation)
 
         for arg, var_name in var_mapping:
             type_str = arg.type_name
@@ -132,13 +213,16 @@ class QueryBuilder:
         self,
         operation: IROperation,
         fields: FieldSelection,
+        var_mapping: List[tuple],
     ) -> str:
-        """Build the body of the operation with nested path."""
-        indent = "  "
+        """Build the body of the operation with nested path.
+
+        var_mapping is the operation's _get_variable_mapping() result, so
+        arguments reference the same variable names as the declarations.
+        """
+        indents = self._ensure_indents(len(operation.path))
         lines = []
 
-        # Get variable mapping for proper variable references
-        var_mapping = self._get_variable_mapping(operation)
         var_name_by_arg = {id(arg): var_name for arg, var_name in var_mapping}
 
         # Build the nested path, e.g., policy { internetFirewall { addRule { ... } } }
@@ -150,7 +234,7 @@ class QueryBuilder:
         parent_arg_idx = 0
 
         for i, segment in enumerate(path):
-            current_indent = indent * (i + 1)
+            current_indent = indents[i + 1]
 
             # Determine which arguments belong to this level
             if i < len(path) - 1:
@@ -179,8 +263,7 @@ class QueryBuilder:
         
         # Close all the braces
         for i in range(len(path) - 1, -1, -1):
-            current_indent = indent * (i + 1)
-            lines.append(f"{current_indent}}}")
+            lines.append(f"{indents[i + 1]}}}")
         
         return "\n".join(lines)
 
@@ -215,14 +298,14 @@ class QueryBuilder:
         depth: int,
     ) -> str:
         """Build field selection for a return type."""
-        indent = "  " * depth
+        indent = self._ensure_indents(depth)[depth]
 
         # Check depth limit
         if depth > fields.max_depth:
             return f"{indent}__typename"
 
         # Handle scalars
-        if self._is_scalar(type_name):
+        if type_name in self._scalar_types:
             return ""  # Scalars don't need subfields
 
         # Get type definition
@@ -250,14 +333,22 @@ class QueryBuilder:
     def _build_custom_fields(
         self,
         type_def: IRType,
-        custom_fields: List[str],
+        custom_fields: Sequence[str],
         indent: str,
         depth: int,
     ) -> str:
         """Build custom field selection based on field paths."""
-        lines = [f"{indent}__typename"]
+        lines: List[str] = []
+        field_tree = self._build_field_tree(custom_fields)
+        self._custom_field_lines(type_def, field_tree, indent, depth, lines)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _build_field_tree(custom_fields: Sequence[str]) -> Dict[str, Any]:
+        """Parse dotted field paths into a nested dict.
 
-        # Parse custom fields into a tree structure
+        "*" selects every field at its level and ends its path.
+        """
         field_tree: Dict[str, Any] = {}
         for field_path in custom_fields:
             parts = field_path.split(".")
@@ -269,78 +360,127 @@ class QueryBuilder:
                 if part not in current:
                     current[part] = {}
                 current = current[part]
+        return field_tree
+
+    def _custom_field_lines(
+        self,
+        type_def: IRType,
+        field_tree: Dict[str, Any],
+        indent: str,
+        depth: int,
+        lines: List[str],
+    ):
+        """Append the lines of a custom selection to `lines`.
+
+        field_tree comes from _build_field_tree(); nested types recurse
+        into its subtrees rather than re-parsing the field paths. Nested
+        selections write into the same list, so the query text is joined
+        once rather than once per level.
+        """
+        lines.append(f"{indent}__typename")
 
         # Build fields from tree
+        scalar_types = self._scalar_types
+        select_all = "*" in field_tree
         for field in type_def.fields:
-            if field.name in field_tree or "*" in field_tree:
-                if self._is_scalar(field.type_name):
+            if field.name in field_tree or select_all:
+                if field.type_name in scalar_types:
                     lines.append(f"{indent}{field.name}")
                 else:
-                    subfields = field_tree.get(field.name, {})
-                    if "*" in field_tree:
-                        subfields = {"*": True}
                     lines.append(f"{indent}{field.name} {{")
                     # Recurse for nested types
                     nested_type = self.schema.get_type_by_name(field.type_name)
                     if nested_type:
-                        sub_custom = [
-                            f[len(field.name)+1:]
-                            for f in custom_fields
-                            if f.startswith(f"{field.name}.")
-                        ] or (["*"] if "*" in subfields else [])
-                        lines.append(self._build_custom_fields(
-                            nested_type, sub_custom, indent + "  ", depth + 1
-                        ))
+                        # Explicit sub-paths win over a "*" at this level
+                        subtree = field_tree.get(field.name) or (
+                            _SELECT_ALL if select_all else {}
+                        )
+                        self._custom_field_lines(
+                            nested_type, subtree, indent + "  ", depth + 1, lines
+                        )
                     lines.append(f"{indent}}}")
 
-        return "\n".join(lines)
-
     def _build_all_fields(
         self,
         type_def: IRType,
         indent: str,
         depth: int,
         fields: FieldSelection,
-        visited: Optional[Set[str]] = None,
+        visited: Optional[frozenset] = None,
     ) -> str:
         """Build complete field selection (all fields recursively)."""
-        if visited is None:
-            visited = set()
+        # Nested levels take their indent from the table, up to max_depth
+        self._ensure_indents(fields.max_depth)
+        return "\n".join(self._all_field_lines(
+            type_def, indent, depth, fields, visited or frozenset()
+        ))
 
+    def _all_field_lines(
+        self,
+        type_def: IRType,
+        indent: str,
+        depth: int,
+        fields: FieldSelection,
+        visited: frozenset,
+    ) -> Tuple[str, ...]:
+        """Return the lines of an ALL-mode selection.
+
+        Nested selections are spliced in as lines, so the query text is
+        joined once rather than once per level. The result only depends on
+        the type, depth and the types already on the path, so it is
+        memoized: a type referenced from many fields or operations is
+        expanded once per distinct position.
+        """
         # Prevent infinite recursion for circular references
         if type_def.name in visited:
-            return f"{indent}__typename"
+            return (f"{indent}__typename",)
+
+        cache_key = (type_def.name, depth, fields.max_depth, visited)
+        cached = self._all_fields_cache.get(cache_key)
+        if cached is not None:
+            return cached
         visited = visited | {type_def.name}
 
+        indents = self._indents
+        scalar_types = self._scalar_types
         lines = []
 
         for field in type_def.fields:
-            if self._is_scalar(field.type_name):
+            if field.type_name in scalar_types:
                 lines.append(f"{indent}{field.name}")
             else:
                 # Check if nested type exists
                 nested_type = self.schema.get_type_by_name(field.type_name)
                 if nested_type and depth < fields.max_depth:
                     lines.append(f"{indent}{field.name} {{")
-                    lines.append(self._build_all_fields(
-                        nested_type, indent + "  ", depth + 1, fields, visited
-                    ))
+                    lines += self._all_field_lines(
+                        nested_type, indents[depth + 1], depth + 1, fields, visited
+                    )
                     lines.append(f"{indent}}}")
                 else:
                     # Too deep or unknown type - just get __typename
                     lines.append(f"{indent}{field.name} {{ __typename }}")
 
-        return "\n".join(lines) if lines else f"{indent}__typename"
+        result = tuple(lines) if lines else (f"{indent}__typename",)
+        self._all_fields_cache[cache_key] = result
+        return result
 
-    def _is_scalar(self, type_name: str) -> bool:
-        """Check if a type is a scalar (no subfields)."""
-        return type_name in self._scalar_types
+    def _ensure_indents(self, depth: int) -> List[str]:
+        """Return the indent table, extended to cover `depth`."""
+        indents = self._indents
+        while len(indents) <= depth:
+            indents.append("  " * len(indents))
+        return indents
 
-    def _to_pascal_case(self, snake_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _to_pascal_case(snake_str: str) -> str:
         """Convert snake_case to PascalCase for operation names."""
         return "".join(word.capitalize() for word in snake_str.split("_"))
 
-    def _type_to_var_suffix(self, type_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _type_to_var_suffix(type_name: str) -> str:
         """Convert a type name to a variable name suffix."""
         # Remove common suffixes for cleaner names
         name = type_name
@@ -11,6 +11,8 @@ Example usage:
     registry.register("DateTime", DateTimeHandler())
     
     # Create custom handler
+    from decimal import Decimal
+
     class MoneyHandler(ScalarHandler):
         python_type = "Decimal"
         import_statement = "from decimal import Decimal"
@@ -19,16 +21,17 @@ Example usage:
             return str(value)
         
         def deserialize(self, value):
-            from decimal import Decimal
             return Decimal(value)
     
     registry.register("Money", MoneyHandler())
 """
 
-from datetime import datetime
-from typing import Any, Dict, Optional, Protocol, runtime_checkable
+from datetime import date, datetime
+from typing import Any, Dict, FrozenSet, Optional
 from uuid import UUID
 
+from typing_extensions import Protocol, runtime_checkable
+
 
 @runtime_checkable
 class ScalarHandler(Protocol):
@@ -56,6 +59,8 @@ class ScalarHandler(Protocol):
 class DateTimeHandler:
     """Handler for DateTime scalars using ISO 8601 format."""
     
+    __slots__ = ()
+    
     python_type = "datetime"
     import_statement = "from datetime import datetime"
     
@@ -65,28 +70,34 @@ class DateTimeHandler:
     
     def deserialize(self, value: str) -> datetime:
         """Parse ISO 8601 string to datetime."""
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        # fromisoformat() only accepts a "Z" (UTC) suffix from Python 3.11
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
 
 
 class DateHandler:
     """Handler for Date scalars using ISO 8601 date format."""
     
+    __slots__ = ()
+    
     python_type = "date"
     import_statement = "from datetime import date"
     
-    def serialize(self, value) -> str:
+    def serialize(self, value: date) -> str:
         """Convert date to ISO 8601 string."""
         return value.isoformat()
     
-    def deserialize(self, value: str):
+    def deserialize(self, value: str) -> date:
         """Parse ISO 8601 date string."""
-        from datetime import date
         return date.fromisoformat(value)
 
 
 class UUIDHandler:
     """Handler for UUID scalars."""
     
+    __slots__ = ()
+    
     python_type = "UUID"
     import_statement = "from uuid import UUID"
     
@@ -102,6 +113,8 @@ class UUIDHandler:
 class JSONHandler:
     """Handler for JSON scalars (pass-through)."""
     
+    __slots__ = ()
+    
     python_type = "Any"
     import_statement = "from typing import Any"
     
@@ -114,6 +127,17 @@ class JSONHandler:
         return value
 
 
+# Built-in handlers, shared by every registry (handlers are stateless)
+_JSON_HANDLER = JSONHandler()
+_DEFAULT_HANDLERS: Dict[str, ScalarHandler] = {
+    "DateTime": DateTimeHandler(),
+    "Date": DateHandler(),
+    "UUID": UUIDHandler(),
+    "JSON": _JSON_HANDLER,
+    "JSONObject": _JSON_HANDLER,
+}
+
+
 class ScalarRegistry:
     """Registry for custom scalar handlers.
     
@@ -128,22 +152,34 @@ class ScalarRegistry:
             python_type = handler.python_type  # "datetime"
     """
     
-    def __init__(self):
-        self._handlers: Dict[str, ScalarHandler] = {}
-        # Register default handlers
-        self._register_defaults()
-    
-    def _register_defaults(self):
-        """Register built-in default handlers."""
-        self.register("DateTime", DateTimeHandler())
-        self.register("Date", DateHandler())
-        self.register("UUID", UUIDHandler())
-        self.register("JSON", JSONHandler())
-        self.register("JSONObject", JSONHandler())
+    def __init__(self, defaults: bool = True):
+        """Create a registry.
+
+        Args:
+            defaults: Start with the built-in DateTime, Date, UUID, JSON and
+                      JSONObject handlers (default). False starts empty.
+        """
+        # The built-in handler instances are shared, only the dict is copied
+        self._handlers: Dict[str, ScalarHandler] = (
+            dict(_DEFAULT_HANDLERS) if defaults else {}
+        )
+        # get_all_imports() result, reset by register()
+        self._imports: Optional[FrozenSet[str]] = None
     
     def register(self, scalar_name: str, handler: ScalarHandler):
-        """Register a handler for a scalar type."""
+        """Register a handler for a scalar type.
+
+        The handler is checked here, once, with plain attribute lookups
+        rather than isinstance() against the ScalarHandler protocol.
+        """
+        for method in ("serialize", "deserialize"):
+            if not callable(getattr(handler, method, None)):
+                raise TypeError(f"{handler!r} does not implement {method}()")
+        for attribute in ("python_type", "import_statement"):
+            if not hasattr(handler, attribute):
+                raise TypeError(f"{handler!r} has no {attribute} attribute")
         self._handlers[scalar_name] = handler
+        self._imports = None
     
     def get(self, scalar_name: str) -> Optional[ScalarHandler]:
         """Get the handler for a scalar type, or None if not registered."""
@@ -153,7 +189,11 @@ class ScalarRegistry:
         """Check if a handler is registered for a scalar type."""
         return scalar_name in self._handlers
     
-    def get_all_imports(self) -> set:
+    def get_all_imports(self) -> FrozenSet[str]:
         """Get all import statements needed for registered handlers."""
-        return {h.import_statement for h in self._handlers.values()}
+        imports = self._imports
+        if imports is None:
+            imports = frozenset(h.import_statement for h in self._handlers.values())
+            self._imports = imports
+        return imports
 
@@ -65,6 +65,15 @@ class TestBasicAuth:
         expected = base64.b64encode(b"user@domain.com:p@ss:word!").decode()
         assert headers == {"Authorization": f"Basic {expected}"}
 
+    def test_basic_auth_credentials_changed(self):
+        """Test that updated credentials are re-encoded."""
+        auth = BasicAuth("user", "old")
+        auth.get_headers()
+        auth.password = "new"
+        
+        expected = base64.b64encode(b"user:new").decode()
+        assert auth.get_headers() == {"Authorization": f"Basic {expected}"}
+
 
 class TestHeaderAuth:
     """Tests for HeaderAuth."""
@@ -99,6 +108,14 @@ class TestHeaderAuth:
         # Original should not be modified
         assert "X-New" not in auth.get_headers()
 
+    def test_copies_constructor_headers(self):
+        """Test that later changes to the passed dict are not picked up."""
+        original = {"X-Key": "value"}
+        auth = HeaderAuth(original)
+        original["X-New"] = "new"
+        
+        assert auth.get_headers() == {"X-Key": "value"}
+
 
 class TestNoAuth:
     """Tests for NoAuth."""
@@ -0,0 +1,86 @@
+"""Tests for the on-disk parsed-schema cache."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gql_pygen.core import parser as parser_module
+from gql_pygen.core.cache import load_cached_ir, save_cached_ir, schema_cache_key
+from gql_pygen.core.parser import SchemaParser
+
+TEST_SCHEMA_DIR = Path(__file__).parent / "test_schema"
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """A private copy of the test schema that tests may modify."""
+    target = tmp_path / "schema"
+    shutil.copytree(TEST_SCHEMA_DIR, target)
+    return target
+
+
+class TestSchemaCache:
+    """Tests for SchemaParser's cache_dir support."""
+
+    def test_second_parse_is_served_from_cache(self, schema_dir, tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / "cache")
+        first = SchemaParser(str(schema_dir), cache_dir=cache_dir).parse_all()
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("schema should not be re-parsed")
+
+        monkeypatch.setattr(parser_module, "parse", fail_parse)
+        second = SchemaParser(str(schema_dir), cache_dir=cache_dir).parse_all()
+
+        assert second == first
+
+    def test_modified_schema_invalidates_cache(self, schema_dir, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        SchemaParser(str(schema_dir), cache_dir=cache_dir).parse_all()
+
+        base = schema_dir / "base.graphqls"
+        base.write_text(base.read_text() + "\nscalar Extra\n")
+        ir = SchemaParser(str(schema_dir), cache_dir=cache_dir).parse_all()
+
+        assert "Extra" in ir.scalars
+
+    def test_only_modified_files_are_reparsed(self, schema_dir, tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / "cache")
+        SchemaParser(str(schema_dir), cache_dir=cache_dir).parse_all()
+
+        base = schema_dir / "base.graphqls"
+        base.write_text(base.read_text() + "\nscalar Extra\n")
+        parsed = []
+        real_parse = parser_module.parse
+
+        def counting_parse(content, **kwargs):
+            parsed.append(content)
+            return real_parse(content, **kwargs)
+
+        monkeypatch.setattr(parser_module, "parse", counting_parse)
+        ir = SchemaParser(str(schema_dir), cache_dir=cache_dir).parse_all()
+
+        assert parsed == [base.read_text()]
+        assert "Extra" in ir.scalars
+
+    def test_key_is_independent_of_schema_location(self, schema_dir, tmp_path):
+        moved = tmp_path / "moved"
+        shutil.copytree(schema_dir, moved)
+        for name in os.listdir(schema_dir):
+            shutil.copystat(schema_dir / name, moved / name)
+
+        def key(root):
+            return schema_cache_key(str(root), sorted(str(p) for p in root.glob("*.graphqls")))
+
+        assert key(schema_dir) == key(moved)
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "broken.pickle").write_bytes(b"not a pickle")
+        assert load_cached_ir(str(tmp_path), "broken") is None
+
+    def test_unpicklable_value_is_not_cached(self, tmp_path):
+        save_cached_ir(str(tmp_path), "bad", lambda: None)
+
+        assert list(tmp_path.iterdir()) == []
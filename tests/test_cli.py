@@ -0,0 +1,89 @@
+"""Tests for CLI helpers."""
+
+import os
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from gql_pygen import cli
+from gql_pygen.cli import iter_schema_sources, load_ir
+from gql_pygen.core.parser import SchemaParser
+
+TEST_SCHEMA_DIR = Path(__file__).parent / "test_schema"
+
+
+@pytest.fixture
+def tgz_archive(tmp_path):
+    path = tmp_path / "schema.tgz"
+    with tarfile.open(path, "w:gz") as tar:
+        tar.add(TEST_SCHEMA_DIR, arcname="schema")
+    return path
+
+
+@pytest.fixture
+def zip_archive(tmp_path):
+    path = tmp_path / "schema.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        for schema_file in TEST_SCHEMA_DIR.glob("*.graphqls"):
+            zf.write(schema_file, f"schema/{schema_file.name}")
+        zf.writestr("schema/README.md", "not a schema")
+    return path
+
+
+class TestIterSchemaSources:
+    """Tests for reading schema files straight out of archives."""
+
+    @pytest.mark.parametrize("archive", ["tgz_archive", "zip_archive"])
+    def test_yields_only_schema_files(self, archive, request):
+        sources = dict(iter_schema_sources(request.getfixturevalue(archive)))
+
+        assert sorted(sources) == ["schema/base.graphqls", "schema/operations.graphqls"]
+        assert sources["schema/base.graphqls"] == (TEST_SCHEMA_DIR / "base.graphqls").read_text()
+
+    @pytest.mark.parametrize("archive", ["tgz_archive", "zip_archive"])
+    def test_parses_same_ir_as_directory(self, archive, request):
+        from_archive = SchemaParser.from_sources(
+            iter_schema_sources(request.getfixturevalue(archive))
+        ).parse_all()
+        from_directory = SchemaParser(str(TEST_SCHEMA_DIR)).parse_all()
+
+        assert from_archive == from_directory
+
+    def test_unsupported_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported archive format"):
+            list(iter_schema_sources(tmp_path / "schema.rar"))
+
+
+class TestLoadIR:
+    """Tests for in-process IR reuse across commands."""
+
+    def test_unchanged_schema_is_parsed_once(self, tmp_path, monkeypatch):
+        schema = tmp_path / "schema.graphqls"
+        schema.write_text("type Query { ping: String }\n")
+        parses = []
+        create_parser = cli.create_parser
+        monkeypatch.setattr(
+            cli, "create_parser", lambda *args: parses.append(args) or create_parser(*args)
+        )
+
+        load_ir(schema, cache=False)
+        load_ir(schema, cache=False)
+        assert len(parses) == 1
+
+        schema.write_text("type Query { ping: String, pong: String }\n")
+        os.utime(schema, ns=(0, schema.stat().st_mtime_ns + 1))
+        assert len(load_ir(schema, cache=False).queries) == 2
+        assert len(parses) == 2
+
+    def test_each_call_gets_its_own_copy(self, tmp_path):
+        schema = tmp_path / "schema.graphqls"
+        schema.write_text("type Query { ping: String }\n")
+
+        first = load_ir(schema, cache=False)
+        first.queries.clear()
+        second = load_ir(schema, cache=False)
+
+        assert second is not first
+        assert [op.name for op in second.queries] == ["ping"]
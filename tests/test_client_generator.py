@@ -1,14 +1,19 @@
 """Unit tests for the client generator."""
 
 import ast
+from typing import Optional
+
 import pytest
+from pydantic import BaseModel, Field
+
 from gql_pygen.core.client_generator import (
     ClientGenerator,
     ClientNode,
     to_snake_case,
     to_pascal_case,
 )
-from gql_pygen.core.ir import IRSchema, IROperation, IRArgument
+from gql_pygen.core.executor import serialize_input
+from gql_pygen.core.ir import IRSchema, IROperation, IRArgument, IRType
 
 
 # =============================================================================
@@ -244,6 +249,80 @@ class TestOperationMethodGeneration:
         assert "return []" in method_code  # Empty list fallback
         assert "[Rule.model_validate(item) for item in result]" in method_code
 
+    def test_input_arguments_are_serialized_inline(self, simple_operation):
+        """Input objects are dumped in the generated method, scalars passed through."""
+        schema = IRSchema(
+            scalars={}, enums={}, types={},
+            inputs={"AddAccountInput": IRType(name="AddAccountInput", fields=[], is_input=True)},
+            interfaces={}, queries=[], mutations=[simple_operation],
+        )
+        gen = ClientGenerator(schema)
+        method_code = "\n".join(gen._generate_operation_method(simple_operation))
+
+        assert '"accountId": account_id,' in method_code
+        assert '"input": serialize_input(input),' in method_code
+        assert "serialized=True," in method_code
+
+    def test_input_arguments_accept_plain_dicts(self):
+        """Dicts given for input objects, alone or in lists, are sent as is."""
+        class RuleInput(BaseModel):
+            rule_name: str = Field(alias="ruleName")
+            note: Optional[str] = None
+
+        schema = IRSchema(
+            inputs={"RuleInput": IRType(name="RuleInput", fields=[], is_input=True)},
+        )
+        gen = ClientGenerator(schema)
+        single = IRArgument(name="rule", type_name="RuleInput")
+        many = IRArgument(name="rules", type_name="RuleInput", is_list=True)
+        model = RuleInput(ruleName="b")
+
+        def evaluate(arg, value):
+            namespace = {"serialize_input": serialize_input, "value": value}
+            return eval(gen._serialize_expr(arg, "value"), namespace)
+
+        assert evaluate(single, {"name": "a"}) == {"name": "a"}
+        assert evaluate(single, model) == {"ruleName": "b"}
+        assert evaluate(single, None) is None
+        assert evaluate(many, [{"name": "a"}, model]) == [{"name": "a"}, {"ruleName": "b"}]
+        assert evaluate(many, None) is None
+
+    def test_scalar_arguments_pass_through(self):
+        """Only input-object arguments go through serialize_input()."""
+        gen = ClientGenerator(IRSchema())
+        arg = IRArgument(name="ids", type_name="ID", is_list=True)
+
+        assert gen._serialize_expr(arg, "ids") == "ids"
+
+    def test_object_responses_bind_validator_lazily(self, simple_operation):
+        """Object return types use a module-level validator bound on first use."""
+        schema = IRSchema(
+            scalars={}, enums={},
+            types={"AccountInfo": IRType(name="AccountInfo", fields=[])},
+            inputs={}, interfaces={}, queries=[], mutations=[simple_operation],
+        )
+        gen = ClientGenerator(schema)
+        code = gen.generate_client_code()
+
+        assert '_validate_AccountInfo = _lazy_validator("AccountInfo")' in code
+        assert "return _validate_AccountInfo(result)" in code
+
+        # Only the helper and bindings run: a missing model does not break them
+        helper = code[code.index("def _lazy_validator"):code.index("\nclass ")]
+        namespace = {}
+        exec(helper, namespace)
+        with pytest.raises(NameError, match="AccountInfo"):
+            namespace["_validate_AccountInfo"]({})
+
+        class AccountInfo:
+            @staticmethod
+            def model_validate(data):
+                return ("validated", data)
+
+        namespace["AccountInfo"] = AccountInfo
+        assert namespace["_validate_AccountInfo"]({"id": 1}) == ("validated", {"id": 1})
+        assert namespace["_validate_AccountInfo"] is AccountInfo.model_validate
+
     def test_method_has_docstring(self, simple_operation, minimal_schema):
         """Generated methods should have docstrings."""
         gen = ClientGenerator(minimal_schema)
@@ -0,0 +1,233 @@
+"""Tests for the GraphQL executor, against a mocked HTTP transport."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from gql_pygen.core import executor as executor_module
+from gql_pygen.core.auth import BearerAuth
+from gql_pygen.core.executor import GraphQLError, GraphQLExecutor
+from gql_pygen.core.ir import IRArgument, IRField, IROperation, IRSchema, IRType
+from gql_pygen.core.query_builder import FieldSelection
+
+URL = "https://api.example.com/graphql"
+
+
+def _operation(name, path, operation_type="query"):
+    return IROperation(
+        name=name,
+        operation_type=operation_type,
+        arguments=[IRArgument(name="id", type_name="ID", is_optional=False)],
+        return_type="Rule",
+        path=path,
+    )
+
+
+@pytest.fixture
+def schema():
+    rule = IRType(name="Rule", fields=[IRField(name="id", type_name="ID")])
+    return IRSchema(
+        types={"Rule": rule},
+        queries=[
+            _operation("rule", ["policy", "rule"]),
+            _operation("account", ["account"]),
+        ],
+        mutations=[_operation("addRule", ["addRule"], operation_type="mutation")],
+    )
+
+
+class _Recorder:
+    """MockTransport handler that records requests and returns one response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        return httpx.Response(200, json=self.response)
+
+    @property
+    def payload(self):
+        return json.loads(self.requests[-1].content)
+
+
+def _executor(schema, handler, **kwargs):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return GraphQLExecutor(URL, BearerAuth("token"), schema=schema, client=client, **kwargs)
+
+
+class TestExecuteMany:
+    """Tests for batching operations into one request."""
+
+    def test_sends_aliased_document_and_renamed_variables(self, schema):
+        handler = _Recorder({"data": {}})
+        executor = _executor(schema, handler)
+
+        asyncio.run(executor.execute_many([
+            (["policy", "rule"], {"id": "r1"}, FieldSelection.ALL),
+            (["account"], {"id": "a1"}, FieldSelection.ALL),
+        ]))
+
+        assert len(handler.requests) == 1
+        payload = handler.payload
+        assert payload["query"].startswith("query Batch($b0_id: ID!, $b1_id: ID!) {")
+        assert "b0: policy {" in payload["query"]
+        assert "rule(id: $b0_id)" in payload["query"]
+        assert "b1: account(id: $b1_id)" in payload["query"]
+        assert payload["variables"] == {"b0_id": "r1", "b1_id": "a1"}
+
+    def test_splits_results_per_operation(self, schema):
+        handler = _Recorder({"data": {
+            "b0": {"rule": {"id": "r1"}},
+            "b1": {"id": "a1"},
+            "b2": None,
+        }})
+        executor = _executor(schema, handler)
+
+        results = asyncio.run(executor.execute_many([
+            (["policy", "rule"], {"id": "r1"}, FieldSelection.ALL),
+            (["account"], {"id": "a1"}, FieldSelection.ALL),
+            (["account"], {"id": "missing"}, FieldSelection.ALL),
+        ]))
+
+        assert results == [{"id": "r1"}, {"id": "a1"}, None]
+
+    def test_rejects_mixed_operation_types(self, schema):
+        handler = _Recorder({"data": {}})
+        executor = _executor(schema, handler)
+
+        with pytest.raises(ValueError, match="only queries or only mutations"):
+            asyncio.run(executor.execute_many([
+                (["account"], {"id": "a1"}, FieldSelection.ALL),
+                (["addRule"], {"id": "r1"}, FieldSelection.ALL),
+            ]))
+        assert handler.requests == []
+
+    def test_empty_batch_sends_nothing(self, schema):
+        handler = _Recorder({"data": {}})
+        executor = _executor(schema, handler)
+
+        assert asyncio.run(executor.execute_many([])) == []
+        assert handler.requests == []
+
+
+class TestJson:
+    """Tests for request/response JSON encoding."""
+
+    PAYLOAD = {"query": "{ a }", "variables": {"name": "é", "n": [1, None]}}
+
+    def test_stdlib_json_when_orjson_is_missing(self, monkeypatch):
+        monkeypatch.setattr(executor_module, "orjson", None)
+
+        encoded = executor_module._dumps(self.PAYLOAD)
+
+        assert encoded == json.dumps(self.PAYLOAD, separators=(",", ":")).encode()
+        assert executor_module._loads(encoded) == self.PAYLOAD
+
+    def test_orjson_when_installed(self):
+        orjson = pytest.importorskip("orjson")
+        assert executor_module.orjson is orjson
+
+        encoded = executor_module._dumps(self.PAYLOAD)
+
+        assert encoded == orjson.dumps(self.PAYLOAD)
+        assert executor_module._loads(encoded) == self.PAYLOAD
+
+
+class TestExecute:
+    """Tests for sending requests and reading responses."""
+
+    def test_serialized_variables_are_sent_as_given(self, schema, monkeypatch):
+        handler = _Recorder({"data": {"account": {"id": "a1"}}})
+        executor = _executor(schema, handler)
+
+        def fail(variables):
+            raise AssertionError("variables were serialized again")
+
+        monkeypatch.setattr(executor, "_serialize_variables", fail)
+        result = asyncio.run(executor.execute_operation(
+            ("account",), {"id": "a1"}, serialized=True,
+        ))
+
+        assert result == {"id": "a1"}
+        assert handler.payload["variables"] == {"id": "a1"}
+
+    def test_unserialized_variables_drop_none(self, schema):
+        handler = _Recorder({"data": {}})
+        executor = _executor(schema, handler)
+
+        asyncio.run(executor.execute("query { a }", {"id": "a1", "skip": None}))
+
+        assert handler.payload["variables"] == {"id": "a1"}
+
+    def test_shared_client_gets_precomputed_headers(self, schema):
+        class CountingAuth(BearerAuth):
+            calls = 0
+
+            def get_headers(self):
+                CountingAuth.calls += 1
+                return super().get_headers()
+
+        handler = _Recorder({"data": {}})
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        executor = GraphQLExecutor(URL, CountingAuth("token"), client=client)
+
+        asyncio.run(executor.execute("query { a }"))
+        asyncio.run(executor.execute("query { b }"))
+
+        assert CountingAuth.calls == 1
+        for request in handler.requests:
+            assert request.headers["Authorization"] == "Bearer token"
+            assert request.headers["Content-Type"] == "application/json"
+
+    def test_close_leaves_caller_owned_client_open(self, schema):
+        handler = _Recorder({"data": {}})
+        executor = _executor(schema, handler)
+        client = executor._client
+
+        asyncio.run(executor.close())
+
+        assert not client.is_closed
+        assert executor._client is client
+        asyncio.run(client.aclose())
+
+    def test_close_closes_own_client(self, schema):
+        executor = GraphQLExecutor(URL, BearerAuth("token"), schema=schema)
+
+        async def open_and_close():
+            client = await executor._get_client()
+            await executor.close()
+            return client
+
+        assert asyncio.run(open_and_close()).is_closed
+        assert executor._client is None
+
+    def test_graphql_errors_raise(self, schema):
+        handler = _Recorder({"errors": [{"message": "boom"}]})
+        executor = _executor(schema, handler)
+
+        with pytest.raises(GraphQLError, match="boom"):
+            asyncio.run(executor.execute("query { a }"))
+
+
+class TestExtractPath:
+    """Tests for reading an operation's result out of the response data."""
+
+    @pytest.fixture
+    def executor(self):
+        return GraphQLExecutor(URL, BearerAuth("token"))
+
+    def test_nested_value(self, executor):
+        data = {"policy": {"rule": {"id": "r1"}}}
+        assert executor._extract_path(data, ["policy", "rule"]) == {"id": "r1"}
+
+    def test_missing_key_or_null_level_is_none(self, executor):
+        assert executor._extract_path({"policy": {}}, ["policy", "rule"]) is None
+        assert executor._extract_path({"policy": None}, ["policy", "rule"]) is None
+
+    def test_non_dict_level_is_none(self, executor):
+        assert executor._extract_path({"policy": "text"}, ["policy", "rule"]) is None
+        assert executor._extract_path({"policy": [1]}, ["policy", "rule"]) is None
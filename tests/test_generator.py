@@ -0,0 +1,127 @@
+"""Unit tests for the code generator."""
+
+from pathlib import Path
+
+import pytest
+
+from gql_pygen.core.generator import CodeGenerator
+from gql_pygen.core.ir import IRField, IRInterface, IRSchema, IRType
+from gql_pygen.core.parser import SchemaParser
+
+TEST_SCHEMA_DIR = Path(__file__).parent / "test_schema"
+
+
+def _read_tree(root: Path) -> dict[str, str]:
+    """Map relative file path -> content for every generated .py file."""
+    return {
+        str(path.relative_to(root)): path.read_text()
+        for path in sorted(root.rglob("*.py"))
+    }
+
+
+@pytest.fixture
+def nested_schema():
+    """A schema with a self-referencing type to exercise field expansion."""
+    return IRSchema(
+        types={
+            "Account": IRType(
+                name="Account",
+                fields=[
+                    IRField(name="id", type_name="ID"),
+                    IRField(name="parent", type_name="Account"),
+                ],
+            ),
+        },
+    )
+
+
+class TestExpandFields:
+    """Tests for _expand_fields."""
+
+    def test_expands_scalars_and_nested_types(self, nested_schema, tmp_path):
+        gen = CodeGenerator(nested_schema, str(tmp_path))
+        result = gen._expand_fields("Account")
+
+        assert result.startswith("__typename")
+        assert "id" in result
+        assert "parent {" in result
+
+    def test_scalar_expands_to_empty(self, nested_schema, tmp_path):
+        gen = CodeGenerator(nested_schema, str(tmp_path))
+        assert gen._expand_fields("String") == ""
+
+    def test_types_shadow_interfaces_of_the_same_name(self, nested_schema, tmp_path):
+        nested_schema.interfaces = {
+            "Account": IRInterface(
+                name="Account", fields=[IRField(name="label", type_name="String")]
+            ),
+        }
+        gen = CodeGenerator(nested_schema, str(tmp_path))
+        result = gen._expand_fields("Account")
+
+        assert "parent {" in result
+        assert "label" not in result
+
+    def test_results_are_memoized(self, nested_schema, tmp_path):
+        gen = CodeGenerator(nested_schema, str(tmp_path))
+        first = gen._expand_fields("Account")
+
+        assert ("Account", 0) in gen._expand_cache
+        assert gen._expand_fields("Account") is first
+
+
+class TestVerifyOutput:
+    """Tests for opt-in syntax validation of generated files."""
+
+    @pytest.fixture
+    def broken_templates(self, tmp_path):
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "enums.py.j2").write_text("def broken(:\n")
+        return str(template_dir)
+
+    def test_invalid_output_written_by_default(self, broken_templates, tmp_path):
+        out = tmp_path / "out"
+        gen = CodeGenerator(IRSchema(), str(out), template_dir=broken_templates)
+        gen._generate_file("enums.py.j2", "enums.py", {"enums": []})
+
+        assert (out / "enums.py").read_text() == "def broken(:\n"
+
+    def test_invalid_output_rejected_when_verifying(self, broken_templates, tmp_path):
+        gen = CodeGenerator(
+            IRSchema(), str(tmp_path / "out"),
+            template_dir=broken_templates,
+            verify_output=True,
+        )
+        with pytest.raises(ValueError, match="Generated invalid Python"):
+            gen._generate_file("enums.py.j2", "enums.py", {"enums": []})
+
+
+class TestParallelGeneration:
+    """Tests for rendering files across worker processes."""
+
+    def test_jobs_output_matches_sequential(self, tmp_path):
+        sequential = tmp_path / "sequential"
+        parallel = tmp_path / "parallel"
+        CodeGenerator(SchemaParser(str(TEST_SCHEMA_DIR)).parse_all(), str(sequential)).generate()
+        CodeGenerator(
+            SchemaParser(str(TEST_SCHEMA_DIR)).parse_all(), str(parallel), jobs=2
+        ).generate()
+
+        assert _read_tree(parallel) == _read_tree(sequential)
+
+
+class TestTemplateBytecodeCache:
+    """Tests for persisting compiled templates in cache_dir."""
+
+    def test_cached_templates_render_the_same(self, tmp_path):
+        ir = SchemaParser(str(TEST_SCHEMA_DIR)).parse_all()
+        cache_dir = tmp_path / "cache"
+        CodeGenerator(ir, str(tmp_path / "uncached")).generate()
+        CodeGenerator(ir, str(tmp_path / "first"), cache_dir=str(cache_dir)).generate()
+        CodeGenerator(ir, str(tmp_path / "second"), cache_dir=str(cache_dir)).generate()
+
+        assert list((cache_dir / "jinja").iterdir())
+        expected = _read_tree(tmp_path / "uncached")
+        assert _read_tree(tmp_path / "first") == expected
+        assert _read_tree(tmp_path / "second") == expected
@@ -135,6 +135,30 @@ class TestHookRunner:
         assert "# Line 0" in result
         assert "# Line 1" in result
 
+    def test_rejects_hook_without_method(self):
+        runner = HookRunner()
+
+        with pytest.raises(TypeError, match="pre_generate"):
+            runner.add_pre_hook(AddHeaderHook("# Header"))
+        with pytest.raises(TypeError, match="post_generate"):
+            runner.add_post_hook(FilterTypesHook())
+        assert runner.pre_hooks == [] and runner.post_hooks == []
+
+    def test_removed_hooks_do_not_run(self):
+        runner = HookRunner()
+        runner.add_post_hook(AddHeaderHook("# Header"))
+        runner.post_hooks.clear()
+
+        assert runner.run_post_hooks("test.py", "code") == "code"
+
+    def test_hooks_added_to_lists_directly_run(self):
+        runner = HookRunner()
+        runner.add_post_hook(AddHeaderHook("# One"))
+        runner.run_post_hooks("test.py", "code")
+        runner.post_hooks.append(AddHeaderHook("# Two"))
+
+        assert runner.run_post_hooks("test.py", "code") == "# Two\n\n# One\n\ncode"
+
 
 class TestProtocolCompliance:
     """Tests for protocol compliance."""
@@ -0,0 +1,36 @@
+"""Tests for SchemaParser."""
+
+from pathlib import Path
+
+from gql_pygen.core.parser import SchemaParser
+
+TEST_SCHEMA_DIR = Path(__file__).parent / "test_schema"
+
+
+class TestParallelParsing:
+    """Tests for parsing schema files in worker processes."""
+
+    def test_matches_sequential_parse(self, monkeypatch):
+        sequential = SchemaParser(str(TEST_SCHEMA_DIR)).parse_all()
+
+        monkeypatch.setattr(SchemaParser, "MIN_FILES_PER_POOL", 1)
+        parallel = SchemaParser(str(TEST_SCHEMA_DIR), jobs=2).parse_all()
+
+        assert parallel == sequential
+
+
+class TestNestedOperations:
+    """Tests for discovering operations inside namespace types."""
+
+    def test_cyclic_namespaces_terminate(self):
+        schema = """
+            type Query { policy: PolicyQueries }
+            type PolicyQueries { sub: SubPolicyQueries, rules: String }
+            type SubPolicyQueries { back: PolicyQueries, rule(id: ID!): String }
+        """
+        ir = SchemaParser.from_sources([("schema.graphqls", schema)]).parse_all()
+
+        paths = [op.path for op in ir.queries]
+        assert ["policy", "sub", "rule"] in paths
+        assert ["policy", "rules"] in paths
+        assert not any("back" in path for path in paths)
@@ -0,0 +1,146 @@
+"""Tests for QueryBuilder."""
+
+import pytest
+
+from gql_pygen.core.ir import IRArgument, IRField, IROperation, IRSchema, IRType
+from gql_pygen.core.query_builder import FieldSelection, QueryBuilder
+
+
+def _operation(name, operation_type="query"):
+    return IROperation(
+        name=name,
+        operation_type=operation_type,
+        arguments=[IRArgument(name="id", type_name="ID", is_optional=False)],
+        return_type="String",
+        path=[name],
+    )
+
+
+class TestBuildBatch:
+    """Tests for batching several operations into one document."""
+
+    def test_aliases_roots_and_prefixes_variables(self):
+        account = _operation("account")
+        builder = QueryBuilder(IRSchema(queries=[account]))
+
+        query = builder.build_batch([
+            (account, FieldSelection.ALL),
+            (account, FieldSelection.ALL),
+        ])
+
+        assert query.startswith("query Batch($b0_id: ID!, $b1_id: ID!) {")
+        assert "b0: account(id: $b0_id)" in query
+        assert "b1: account(id: $b1_id)" in query
+        assert QueryBuilder.batch_variable(1, "id") == "b1_id"
+
+    def test_rejects_mixed_operation_types(self):
+        query = _operation("account")
+        mutation = _operation("addAccount", operation_type="mutation")
+        builder = QueryBuilder(IRSchema(queries=[query], mutations=[mutation]))
+
+        with pytest.raises(ValueError):
+            builder.build_batch([(query, FieldSelection.ALL), (mutation, FieldSelection.ALL)])
+
+
+class TestAllFields:
+    """Tests for ALL-mode field selection."""
+
+    @pytest.fixture
+    def schema(self):
+        account = IRType(name="Account", fields=[
+            IRField(name="id", type_name="ID"),
+            IRField(name="parent", type_name="Account"),
+            IRField(name="owner", type_name="User"),
+        ])
+        user = IRType(name="User", fields=[
+            IRField(name="id", type_name="ID"),
+            IRField(name="account", type_name="Account"),
+        ])
+        return IRSchema(types={"Account": account, "User": user})
+
+    def test_cycles_stop_at_typename(self, schema):
+        fields = QueryBuilder(schema)._build_return_fields("Account", FieldSelection.ALL, 1)
+
+        assert fields.split("\n") == [
+            "  id",
+            "  parent {",
+            "    __typename",
+            "  }",
+            "  owner {",
+            "    id",
+            "    account {",
+            "      __typename",
+            "    }",
+            "  }",
+        ]
+
+    def test_built_queries_are_cached_per_max_depth(self, schema):
+        operation = IROperation(
+            name="account", operation_type="query", arguments=[],
+            return_type="Account", path=["account"],
+        )
+        builder = QueryBuilder(IRSchema(types=schema.types, queries=[operation]))
+
+        deep = builder.build(operation, FieldSelection.ALL)
+        shallow = builder.build(operation, FieldSelection(max_depth=2))
+
+        assert builder.build(operation, FieldSelection.ALL) is deep
+        assert shallow != deep
+        assert "owner { __typename }" in shallow
+
+    def test_repeated_expansions_are_memoized(self, schema, monkeypatch):
+        builder = QueryBuilder(schema)
+        user = schema.types["User"]
+        first = builder._build_all_fields(user, "  ", 1, FieldSelection.ALL)
+
+        def fail_lookup(name):
+            raise AssertionError("expansion should come from the cache")
+
+        monkeypatch.setattr(schema, "get_type_by_name", fail_lookup)
+        assert builder._build_all_fields(user, "  ", 1, FieldSelection.ALL) == first
+
+
+class TestFieldSelection:
+    """Tests for FieldSelection as a cache key."""
+
+    def test_equal_selections_hash_alike(self):
+        selected = FieldSelection.select("id", "name")
+        listed = FieldSelection(mode=selected.mode, custom_fields=["id", "name"])
+
+        assert listed.custom_fields == ("id", "name")
+        assert listed == selected
+        assert hash(listed) == hash(selected)
+
+    def test_custom_queries_are_cached(self):
+        account = _operation("account")
+        builder = QueryBuilder(IRSchema(queries=[account]))
+
+        query = builder.build(account, FieldSelection.select("id"))
+
+        assert builder.build(account, FieldSelection.select("id")) is query
+
+
+class TestVariables:
+    """Tests for variable declarations."""
+
+    def test_query_and_mutation_with_same_name(self):
+        query = _operation("account")
+        mutation = _operation("account", operation_type="mutation")
+        mutation.arguments = mutation.arguments + [
+            IRArgument(name="name", type_name="String", is_optional=False),
+        ]
+        builder = QueryBuilder(IRSchema(queries=[query], mutations=[mutation]))
+
+        builder.build(query, FieldSelection.ALL)
+        batch = builder.build_batch([(mutation, FieldSelection.ALL)])
+
+        assert batch.startswith("mutation Batch($b0_id: ID!, $b0_name: String!) {")
+
+    def test_query_and_mutation_are_cached_apart(self):
+        query = _operation("account")
+        mutation = _operation("account", operation_type="mutation")
+        builder = QueryBuilder(IRSchema(queries=[query], mutations=[mutation]))
+
+        builder.build(query, FieldSelection.ALL)
+
+        assert builder.build(mutation, FieldSelection.ALL).startswith("mutation Account(")
@@ -109,6 +109,17 @@ class TestScalarRegistry:
         assert registry.has("JSON")
         assert registry.has("JSONObject")
 
+    def test_empty_registry(self):
+        registry = ScalarRegistry(defaults=False)
+        assert not registry.has("DateTime")
+        assert registry.get_all_imports() == frozenset()
+
+    def test_registries_do_not_share_registrations(self):
+        registry = ScalarRegistry()
+        registry.register("DateTime", JSONHandler())
+
+        assert isinstance(ScalarRegistry().get("DateTime"), DateTimeHandler)
+
     def test_get_handler(self):
         registry = ScalarRegistry()
         handler = registry.get("DateTime")
@@ -137,6 +148,31 @@ class TestScalarRegistry:
         assert registry.has("Money")
         assert registry.get("Money").python_type == "Decimal"
 
+    def test_rejects_incomplete_handler(self):
+        registry = ScalarRegistry()
+
+        class NoDeserialize:
+            python_type = "str"
+            import_statement = ""
+
+            def serialize(self, value):
+                return value
+
+        class NoPythonType:
+            import_statement = ""
+
+            def serialize(self, value):
+                return value
+
+            def deserialize(self, value):
+                return value
+
+        with pytest.raises(TypeError, match="deserialize"):
+            registry.register("Broken", NoDeserialize())
+        with pytest.raises(TypeError, match="python_type"):
+            registry.register("Broken", NoPythonType())
+        assert not registry.has("Broken")
+
     def test_get_all_imports(self):
         registry = ScalarRegistry()
         imports = registry.get_all_imports()
@@ -144,6 +180,23 @@ class TestScalarRegistry:
         assert "from datetime import date" in imports
         assert "from uuid import UUID" in imports
 
+    def test_register_updates_imports(self):
+        registry = ScalarRegistry()
+        assert registry.get_all_imports() is registry.get_all_imports()
+
+        class MoneyHandler:
+            python_type = "Decimal"
+            import_statement = "from decimal import Decimal"
+
+            def serialize(self, value):
+                return str(value)
+
+            def deserialize(self, value):
+                return value
+
+        registry.register("Money", MoneyHandler())
+        assert "from decimal import Decimal" in registry.get_all_imports()
+
 
 class TestScalarHandlerProtocol:
     """Tests for protocol compliance."""